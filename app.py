@@ -2,30 +2,89 @@
 오색그린야드호텔 리뷰 분석 웹 애플리케이션 (간단 버전)
 """
 import os
-import uuid
+import re
+import io
+import csv
+import secrets
+import shutil
+import tempfile
+import json
 import logging
+import multiprocessing
+import threading
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from flask import Flask, render_template, request, jsonify, send_file, flash, redirect, url_for
+from flask import Flask, render_template, request, session, jsonify, send_from_directory, flash, redirect, url_for
+import numpy as np
 import pandas as pd
+from werkzeug.routing import BaseConverter
 
-# 차트 생성 모듈 import
 try:
-    from src.plots import PlotGenerator
-    from src.config import FIGURES_DIR
-    CHARTS_AVAILABLE = True
-except ImportError as e:
-    logging.warning(f"차트 모듈 import 실패: {e}")
-    CHARTS_AVAILABLE = False
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import pyarrow.compute as pc
+    PYARROW_COMPUTE_AVAILABLE = True
+except ImportError:
+    PYARROW_COMPUTE_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+from src._jit_kernels import NUMBA_AVAILABLE, count_keyword_groups, count_keyword_hits
+
+# 차트 생성 모듈은 첫 분석 요청 시 import (워커 시작 시 matplotlib 로딩 생략)
+CHARTS_AVAILABLE = True
+_chart_executor = None
+_chart_executor_lock = threading.Lock()  # gthread 워커의 여러 스레드가 풀을 중복 생성하지 않도록 보호
+_plot_generator_cls = None
 
 # Flask 앱 초기화
 app = Flask(__name__)
 app.secret_key = 'your-secret-key-here'
 
+class SessionIdConverter(BaseConverter):
+    """세션 ID URL 변환기 (token_urlsafe 22자, 기존 UUID hex/하이픈 형식 허용)"""
+    regex = r'(?:[A-Za-z0-9_-]{22}|[0-9a-f]{32}|[0-9a-f]{8}(?:-[0-9a-f]{4}){3}-[0-9a-f]{12})'
+
+app.url_map.converters['session_id'] = SessionIdConverter
+
 # 업로드 설정
 UPLOAD_FOLDER = Path('uploads')
-ALLOWED_EXTENSIONS = {'csv'}
+DATA_FILENAME = 'data.csv'  # 업로드 파일은 항상 이 이름으로 저장
+ANALYSIS_CACHE_FILE = 'summary.json'  # 세션별 분석 결과 캐시
+RESULTS_PAGE_FILE = 'results.html'  # 렌더링된 결과 페이지 캐시
 MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB 제한
+UPLOAD_CHUNK_SIZE = 1 << 20  # 업로드 파일 저장 버퍼 (1MB)
+PLOT_CACHE_MAX_AGE = 0  # 차트는 재분석 때 같은 URL로 다시 생성되므로 매번 ETag로 재검증 (no-cache)
+CHART_WORKERS = 2  # 백그라운드 차트 생성 프로세스 수
+CHART_FILENAMES = {
+    'sentiment': 'sentiment_distribution.png',
+    'trend': 'yearly_trend.png',
+    'keywords': 'negative_keywords.png'
+}
+
+# 분석에 필요한 컬럼만 읽기 (pyarrow 엔진 우선)
+REVIEW_COLUMNS = ['평점', '내용', '작성일자']
+CSV_HEADER_PROBE_BYTES = 8192  # 헤더 검증 시 읽는 최대 바이트
+MAX_CSV_COLUMNS = 50  # 허용 컬럼 수 상한
+REQUIRED_ANY_COLUMNS = ('평점', '내용')  # 둘 중 하나는 있어야 분석 가능
+RATING_DTYPE = 'float64'  # 소수점 평점(4.5 등)도 그대로 읽도록 실수로 로드 (검증 후 정수이면 int8로 축소)
+READ_KW = dict(engine='pyarrow', dtype_backend='pyarrow', dtype={'평점': 'double[pyarrow]'})
+# 평점 구간 경계: 6 이하 부정 / 6 초과 8 미만 중립 / 8 이상 긍정 (searchsorted 한 번으로 분류)
+SENTIMENT_BIN_EDGES = np.array([6.0, np.nextafter(8.0, -np.inf)])
+NUMBA_MIN_ROWS = 20_000  # 이 행 수 이상이면 Numba 병렬 커널로 키워드 집계
+ANALYSIS_CHUNK_SIZE = 50_000  # 대용량 CSV 청크 크기 (행)
+CHUNKED_READ_MIN_BYTES = 8 * 1024 * 1024  # 이 크기 이상이면 청크 단위로 집계
 
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 app.config['MAX_CONTENT_LENGTH'] = MAX_CONTENT_LENGTH
@@ -33,18 +92,537 @@ app.config['MAX_CONTENT_LENGTH'] = MAX_CONTENT_LENGTH
 # 업로드 폴더 생성
 UPLOAD_FOLDER.mkdir(exist_ok=True)
 
-# 로깅 설정
-logging.basicConfig(level=logging.INFO)
+# 로깅 설정 (운영 환경에서는 경고 이상만 출력)
+IS_PRODUCTION = os.environ.get('FLASK_ENV') == 'production'
+logging.basicConfig(level=logging.WARNING if IS_PRODUCTION else logging.INFO)
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=None)
+def _build_joined_pattern(keywords):
+    """키워드 튜플을 하나의 정규식으로 결합"""
+    return re.compile('|'.join(re.escape(keyword) for keyword in keywords))
+
+# Aspect 분석 키워드 (간단한 키워드 매칭, 시작 시 한 번만 생성하는 불변 튜플)
+ASPECT_KEYWORDS = {
+    '청결': ('청결', '깨끗', '더럽', '지저분', '먼지', '바닥', '청소', '깔끔', '위생'),
+    '시설/온수': ('시설', '온수', '샤워', '온도', '따뜻', '차갑', '잠금장치', '리모델링', '노후', '낡'),
+    '직원응대': ('직원', '응대', '서비스', '친절', '불친절', '태도', '안내', '프론트'),
+    '가격': ('가격', '비싸', '저렴', '가성비', '요금', '비용', '패키지', '강정', '조식'),
+    '온천수': ('온천', '탄산', '온천수', '탕', '사우나', '찜질방', '목욕', '온천욕')
+}
+ASPECT_PATTERNS = {
+    aspect: _build_joined_pattern(keywords)
+    for aspect, keywords in ASPECT_KEYWORDS.items()
+}
+
+# 부정 키워드 (차트용, 캡처 그룹 하나로 결합하여 한 번에 추출)
+NEGATIVE_KEYWORDS = (
+    '아쉽', '실망', '별로', '안좋', '나쁘', '불편', '문제', '결함', '고장',
+    '부족', '떨어지', '낮', '안되', '못하', '싫', '짜증', '화나', '불쾌',
+    '실종', '허', '늘어지', '떨어지', '낡', '오래', '노후', '지저분', '더럽',
+    '차갑', '춥', '시끄럽', '소음', '비싸', '바가지', '불친절', '무시',
+    '격양', '말문막힘', '아쉬워', '후회', '다시안갈', '추천안함'
+)
+NEGATIVE_PATTERN = re.compile('(' + '|'.join(re.escape(keyword) for keyword in NEGATIVE_KEYWORDS) + ')')
+
+def _build_negative_automaton():
+    """부정 키워드 Aho-Corasick 오토마톤 생성 (pyahocorasick 설치 시)"""
+    if not AHOCORASICK_AVAILABLE:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword in NEGATIVE_KEYWORDS:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+NEGATIVE_AUTOMATON = _build_negative_automaton()
+
 def allowed_file(filename):
     """파일 확장자 검증"""
-    return '.' in filename and \
-           filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+    return filename.lower().endswith('.csv')
 
 def generate_session_id():
     """세션 ID 생성"""
-    return str(uuid.uuid4())
+    return secrets.token_urlsafe(16)
+
+def jsonify_fast(obj, status=200):
+    """JSON 응답 생성 (orjson 사용 가능 시 C 구현으로 직렬화)"""
+    if ORJSON_AVAILABLE:
+        return app.response_class(orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY),
+                                  status=status, mimetype='application/json')
+    response = jsonify(obj)
+    response.status_code = status
+    return response
+
+def _get_plot_generator():
+    """PlotGenerator 클래스 지연 로드 (import 실패 시 None)"""
+    global CHARTS_AVAILABLE, _plot_generator_cls
+    if _plot_generator_cls is None and CHARTS_AVAILABLE:
+        try:
+            from src.plots import PlotGenerator
+            _plot_generator_cls = PlotGenerator
+        except ImportError as e:
+            logger.warning("차트 모듈 import 실패: %s", e)
+            CHARTS_AVAILABLE = False
+    return _plot_generator_cls
+
+@lru_cache(maxsize=1)
+def _rating_range():
+    """공용 유효 평점 범위 지연 로드 (src.config는 matplotlib을 import하므로 첫 분석 시 로드, 실패 시 None)"""
+    try:
+        from src.config import RATING_RANGE
+    except ImportError as e:
+        logger.warning("설정 모듈 import 실패, 평점 int8 축소를 건너뜁니다: %s", e)
+        return None
+    return RATING_RANGE
+
+def _rating_values(ratings):
+    """평점 배열 (결측 없이 유효 범위의 정수이면 int8로 축소, 아니면 결측을 NaN으로 둔 float64)"""
+    values = ratings.to_numpy(dtype='float64', na_value=np.nan)
+    rating_range = _rating_range()
+    if (rating_range is not None and len(values)
+            and rating_range[0] <= values.min() and values.max() <= rating_range[1]
+            and not (values % 1).any()):
+        # 이후 구간 분류/합계/연도별 집계가 1바이트 배열을 읽음 (NaN이 있으면 min/max가 NaN이라 축소하지 않음)
+        return values.astype(np.int8)
+    return values
+
+def _get_chart_executor():
+    """차트 생성용 프로세스 풀 지연 생성 (프로세스당 하나)"""
+    global _chart_executor
+    with _chart_executor_lock:
+        if _chart_executor is None:
+            # 스레드가 있는 워커에서 fork하면 다른 스레드가 잡고 있던 락을 자식이 물려받아 멈출 수 있으므로
+            # forkserver(미지원 플랫폼은 spawn)로 깨끗한 프로세스에서 시작
+            start_method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+            _chart_executor = ProcessPoolExecutor(max_workers=CHART_WORKERS,
+                                                  mp_context=multiprocessing.get_context(start_method))
+        return _chart_executor
+
+def _discard_chart_executor(executor):
+    """사용할 수 없게 된 프로세스 풀을 종료하고 다음 요청에서 새로 만들도록 비움"""
+    global _chart_executor
+    with _chart_executor_lock:
+        if _chart_executor is executor:
+            _chart_executor = None
+    executor.shutdown(wait=False, cancel_futures=True)
+
+def _render_charts(output_dir, sentiment_data, yearly_data, top_keywords):
+    """세션 차트 PNG 생성 (백그라운드 프로세스에서 실행)"""
+    chart_files = {}
+    PlotGenerator = _get_plot_generator()
+    if PlotGenerator is None:
+        return chart_files
+    
+    # 임시 디렉토리에 그린 뒤 완성된 파일만 옮겨서 폴링 중 미완성 PNG가 제공되지 않게 함
+    work_dir = Path(tempfile.mkdtemp(prefix='.render-', dir=output_dir))
+    try:
+        plotter = PlotGenerator(work_dir)
+        renderers = (
+            ('sentiment', sentiment_data, plotter.create_sentiment_pie_chart),
+            ('trend', yearly_data, plotter.create_yearly_trend_plot),
+            ('keywords', top_keywords or None, plotter.create_negative_keywords_bar)
+        )
+        for name, data, render in renderers:
+            if data is None:
+                continue
+            try:
+                chart = render(data)
+                if chart:
+                    chart_file = output_dir / CHART_FILENAMES[name]
+                    os.replace(chart, chart_file)
+                    chart_files[name] = str(chart_file)
+            except Exception as e:
+                logger.warning("%s 차트 생성 실패: %s", name, e)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    
+    return chart_files
+
+def _log_chart_result(future):
+    """백그라운드 차트 생성 결과 로깅"""
+    try:
+        chart_files = future.result()
+    except Exception as e:
+        logger.error("차트 생성 중 오류: %s", e)
+        return
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("차트 생성 완료: %s", list(chart_files))
+
+def _dispatch_charts(output_dir, sentiment_data, yearly_data, top_keywords):
+    """차트 생성을 백그라운드 워커에 맡기고 생성될 차트 경로를 바로 반환"""
+    planned = {
+        'sentiment': sentiment_data is not None,
+        'trend': yearly_data is not None,
+        'keywords': bool(top_keywords)
+    }
+    chart_files = {}
+    for name, enabled in planned.items():
+        if enabled:
+            chart_file = output_dir / CHART_FILENAMES[name]
+            # 이전 분석의 차트가 새 차트로 오인되지 않도록 제거 (없으면 404 → 클라이언트 재시도)
+            chart_file.unlink(missing_ok=True)
+            chart_files[name] = str(chart_file)
+    if not chart_files:
+        return chart_files
+    
+    executor = None
+    try:
+        executor = _get_chart_executor()
+        future = executor.submit(_render_charts, output_dir, sentiment_data, yearly_data, top_keywords)
+    except Exception as e:
+        # 프로세스 풀 사용 불가 시 (BrokenProcessPool 등) 풀을 정리하고 요청 안에서 직접 생성
+        logger.warning("백그라운드 차트 생성 불가, 동기 생성으로 전환: %s", e)
+        if executor is not None:
+            _discard_chart_executor(executor)
+        return _render_charts(output_dir, sentiment_data, yearly_data, top_keywords)
+    future.add_done_callback(_log_chart_result)
+    return chart_files
+
+def _probe_csv_header(csv_file):
+    """CSV 앞부분만 읽어 헤더 검증 (컬럼 수 상한, 필수 컬럼 확인)"""
+    with open(csv_file, 'rb') as f:
+        head = f.read(CSV_HEADER_PROBE_BYTES)
+    if not head.strip():
+        raise ValueError('빈 CSV 파일입니다.')
+    if b'\n' not in head and len(head) == CSV_HEADER_PROBE_BYTES:
+        raise ValueError('CSV 헤더가 너무 깁니다.')
+    
+    header = next(csv.reader(io.StringIO(head.decode('utf-8-sig', errors='replace'))))
+    if len(header) > MAX_CSV_COLUMNS:
+        raise ValueError(f'컬럼 수가 너무 많습니다. (최대 {MAX_CSV_COLUMNS}개)')
+    if not any(col in header for col in REQUIRED_ANY_COLUMNS):
+        raise ValueError("'평점' 또는 '내용' 컬럼이 필요합니다.")
+    return header
+
+def _review_columns(csv_file):
+    """CSV 헤더에서 분석에 사용할 컬럼만 선택"""
+    header = _probe_csv_header(csv_file)
+    return [col for col in REVIEW_COLUMNS if col in header]
+
+def _load_reviews(csv_file):
+    """분석용 리뷰 CSV 로드"""
+    usecols = _review_columns(csv_file)
+    try:
+        return pd.read_csv(csv_file, usecols=usecols, **READ_KW)
+    except (ImportError, TypeError, ValueError):
+        # pyarrow 미설치, 또는 dtype_backend/pyarrow 엔진이 처리하지 못하는 입력이면 기본 C 엔진 사용
+        return pd.read_csv(csv_file, usecols=usecols, dtype={'평점': RATING_DTYPE})
+
+def _iter_review_chunks(csv_file):
+    """리뷰 CSV를 청크 단위로 읽기 (작은 파일은 pyarrow로 한 번에 읽음)"""
+    if csv_file.stat().st_size < CHUNKED_READ_MIN_BYTES:
+        yield _load_reviews(csv_file)
+        return
+    # pyarrow 엔진은 chunksize를 지원하지 않으므로 C 엔진으로 스트리밍
+    yield from pd.read_csv(csv_file, usecols=_review_columns(csv_file), dtype={'평점': RATING_DTYPE},
+                           chunksize=ANALYSIS_CHUNK_SIZE)
+
+def _match_aspects(texts):
+    """Aspect별 언급 여부 마스크 행렬 (Aspect x 리뷰, 리뷰당 Aspect 정규식 한 번 스캔)"""
+    arrow_backed = PYARROW_COMPUTE_AVAILABLE and hasattr(texts.array, '__arrow_array__')
+    if not arrow_backed and NUMBA_AVAILABLE and len(texts) >= NUMBA_MIN_ROWS:
+        counts = count_keyword_groups(texts.fillna('').tolist(), list(ASPECT_KEYWORDS.values()))
+        return (counts > 0).T
+    
+    # 한 번 계산한 마스크를 Aspect 언급 수와 감정 교차 집계에 함께 재사용
+    masks = np.empty((len(ASPECT_PATTERNS), len(texts)), dtype=bool)
+    if arrow_backed:
+        # Arrow 문자열 버퍼를 C++ 커널로 직접 스캔
+        arrow_texts = texts.array.__arrow_array__()
+        for row, pattern in enumerate(ASPECT_PATTERNS.values()):
+            masks[row] = pc.fill_null(pc.match_substring_regex(arrow_texts, pattern.pattern), False) \
+                .to_numpy(zero_copy_only=False)
+        return masks
+    for row, pattern in enumerate(ASPECT_PATTERNS.values()):
+        # Arrow 문자열 컬럼은 컴파일된 패턴을 받지 않으므로 패턴 문자열 전달
+        masks[row] = texts.str.contains(pattern.pattern, regex=True, na=False).to_numpy(dtype=bool)
+    return masks
+
+def _extract_years(dates):
+    """작성일자에서 연도 추출 (ISO 날짜는 형식 지정 파싱, 그 외 형식은 추론 파싱)
+
+    파싱할 수 없는 날짜는 결측(<NA>)으로 두어 연도별 집계에서만 제외
+    """
+    try:
+        parsed = pd.to_datetime(dates, format='%Y-%m-%d', cache=True)
+    except (ValueError, TypeError):
+        parsed = pd.to_datetime(dates, errors='coerce', cache=True)
+    return parsed.dt.year.astype('Int64')
+
+def _count_negative_keywords(texts):
+    """부정 키워드 출현 횟수 집계 (Aho-Corasick, Numba 커널 또는 단일 정규식 패스)"""
+    counts = Counter()
+    if NEGATIVE_AUTOMATON is not None:
+        # 모든 키워드를 리뷰당 한 번의 순회로 매칭 (겹치지 않는 최장 일치)
+        for text in texts.dropna().to_numpy():
+            counts.update(keyword for _, keyword in NEGATIVE_AUTOMATON.iter_long(text))
+        return counts
+    if NUMBA_AVAILABLE and len(texts) >= NUMBA_MIN_ROWS:
+        try:
+            # 정규식 alternation과 같은 최좌측 매칭을 병렬 커널로 집계
+            hits = count_keyword_hits(texts.dropna().tolist(), NEGATIVE_KEYWORDS)
+            for keyword, count in zip(NEGATIVE_KEYWORDS, hits.tolist()):
+                if count:
+                    counts[keyword] += count
+            return counts
+        except Exception as e:
+            logger.warning("Numba 키워드 집계 실패, 정규식으로 대체: %s", e)
+    for keyword, count in texts.str.extractall(NEGATIVE_PATTERN)[0].value_counts().items():
+        counts[keyword] = int(count)
+    return counts
+
+def _save_results(session_folder, summary):
+    """분석 결과를 세션 폴더에 저장 (임시 파일에 쓴 뒤 교체하여 부분 읽기 방지)"""
+    tmp_file = session_folder / (ANALYSIS_CACHE_FILE + '.tmp')
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(summary, f, ensure_ascii=False)
+    os.replace(tmp_file, session_folder / ANALYSIS_CACHE_FILE)
+
+@lru_cache(maxsize=64)
+def _load_results(session_id, mtime):
+    """저장된 분석 결과(JSON) 로드 (파일 수정 시각 기준으로 워커 내 메모이제이션)"""
+    with open(UPLOAD_FOLDER / session_id / ANALYSIS_CACHE_FILE, encoding='utf-8') as f:
+        return json.load(f)
+
+def _fresh_cache_mtime(session_folder, csv_file):
+    """업로드 파일보다 최신인 분석 결과 캐시의 수정 시각 (없으면 None)"""
+    cache_file = session_folder / ANALYSIS_CACHE_FILE
+    if not cache_file.exists():
+        return None
+    cache_mtime = cache_file.stat().st_mtime_ns
+    return cache_mtime if cache_mtime >= csv_file.stat().st_mtime_ns else None
+
+def _load_or_analyze(session_id, session_folder, csv_file):
+    """저장된 분석 결과 로드 (없거나 오래됐으면 분석 후 저장)"""
+    cache_mtime = _fresh_cache_mtime(session_folder, csv_file)
+    if cache_mtime is not None:
+        return _load_results(session_id, cache_mtime)
+    summary = _analyze_session(session_folder, csv_file)
+    _save_results(session_folder, summary)
+    return summary
+
+def _render_results(session_id, summary):
+    """결과 페이지 렌더링"""
+    session_info = {
+        'session_id': session_id,
+        'created_at': datetime.now().isoformat(),
+        'summary': summary,
+        'analysis_results': {
+            'KPI': {'총_리뷰_수': summary['total_reviews']},
+            '우선순위': {'상위_3개': []},
+            '고급분석': False
+        }
+    }
+    
+    # 플래시 메시지가 포함된 페이지는 캐시하지 않음 (렌더링 시 소비되므로 미리 확인)
+    has_flashes = bool(session.get('_flashes'))
+    html = render_template('results.html', 
+                         session_info=session_info,
+                         session_id=session_id)
+    
+    if not has_flashes:
+        session_folder = UPLOAD_FOLDER / session_id
+        tmp_file = session_folder / (RESULTS_PAGE_FILE + '.tmp')
+        tmp_file.write_text(html, encoding='utf-8')
+        os.replace(tmp_file, session_folder / RESULTS_PAGE_FILE)
+    
+    return html
+
+def _summarize(total_reviews, average_rating, positive_ratio, negative_ratio, neutral_ratio,
+               top_aspect, chart_files, aspect_sentiment, priority_scores):
+    """분석 지표를 API/결과 페이지용 요약 딕셔너리로 변환"""
+    # 주요 강점/약점을 Aspect 결과 한 번 순회로 결정
+    main_strength = main_weakness = '분석 불가'
+    best_positive = best_negative = None
+    for aspect, stats in aspect_sentiment.items():
+        if best_positive is None or stats['positive_ratio'] > best_positive:
+            main_strength, best_positive = aspect, stats['positive_ratio']
+        if best_negative is None or stats['negative_ratio'] > best_negative:
+            main_weakness, best_negative = aspect, stats['negative_ratio']
+    
+    if positive_ratio > negative_ratio:
+        overall_sentiment = '긍정'
+    elif negative_ratio > positive_ratio:
+        overall_sentiment = '부정'
+    else:
+        overall_sentiment = '중립'
+    
+    if negative_ratio > 40:
+        priority_level = '높음'
+    elif negative_ratio > 20:
+        priority_level = '중간'
+    else:
+        priority_level = '낮음'
+    
+    return {
+        'total_reviews': total_reviews,
+        'average_rating': round(average_rating, 2),
+        'positive_ratio': round(positive_ratio, 1),
+        'negative_ratio': round(negative_ratio, 1),
+        'neutral_ratio': round(neutral_ratio, 1),
+        'top_priority': top_aspect,
+        'data_period': '성공',
+        'files': {
+            'html_report': None,
+            'pdf_report': None,
+            'pptx_summary': None
+        },
+        'charts': chart_files,
+        'aspect_sentiment': aspect_sentiment,
+        'priority_scores': priority_scores,
+        'key_insights': {
+            'overall_sentiment': overall_sentiment,
+            'main_strength': main_strength,
+            'main_weakness': main_weakness,
+            'improvement_potential': round((negative_ratio / 100) * total_reviews, 0) if negative_ratio > 0 else 0
+        },
+        'strategic_recommendations': {
+            'immediate_action': top_aspect,
+            'long_term_focus': '고객 만족도 향상' if negative_ratio > 30 else '서비스 품질 유지',
+            'priority_level': priority_level
+        }
+    }
+
+def _analyze_session(session_folder, csv_file):
+    """업로드된 리뷰 데이터 분석 및 차트 생성 (분석 API와 결과 페이지 공용)"""
+    # 청크별로 누적 통계만 보관하고 원본 DataFrame은 바로 해제
+    total_reviews = 0
+    rating_sum = 0.0
+    rating_count = 0
+    sentiment_totals = np.zeros(3, dtype=np.int64)  # 부정/중립/긍정
+    mention_totals = np.zeros((len(ASPECT_KEYWORDS), 3), dtype=np.int64)
+    negative_keyword_counts = Counter()
+    yearly_totals = None
+    has_rating = has_text = has_date = False
+    trend_failed = False  # 한 청크라도 집계에 실패하면 이후 청크로 일부 연도만 다시 쌓지 않도록 유지
+    
+    for chunk in _iter_review_chunks(csv_file):
+        total_reviews += len(chunk)
+        has_rating = '평점' in chunk.columns
+        has_text = '내용' in chunk.columns
+        has_date = has_date or '작성일자' in chunk.columns
+        
+        if has_rating:
+            # 평점을 부정(0)/중립(1)/긍정(2) 구간으로 나눠 한 번에 집계
+            ratings = _rating_values(chunk['평점'])
+            valid = ~np.isnan(ratings)
+            buckets = np.searchsorted(SENTIMENT_BIN_EDGES, ratings)
+            buckets[~valid] = 1  # 평점 결측은 중립으로 분류
+            sentiment_totals += np.bincount(buckets, minlength=3)
+            rating_sum += float(ratings[valid].sum())
+            rating_count += int(valid.sum())
+        
+        if has_text:
+            # Aspect 언급 마스크와 감정 구간을 (Aspect x 감정) 행렬로 누적
+            mention_matrix = _match_aspects(chunk['내용'])
+            if has_rating:
+                mention_totals += mention_matrix @ np.eye(3, dtype=np.int64)[buckets]
+            else:
+                mention_totals[:, 1] += mention_matrix.sum(axis=1)
+            negative_keyword_counts.update(_count_negative_keywords(chunk['내용']))
+        
+        if has_date and has_rating and not trend_failed:
+            # 연도별 리뷰 수/평점 합계 누적 (집계 실패 시 트렌드 차트 생략)
+            try:
+                years = _extract_years(chunk['작성일자']).rename('연도')
+                yearly = pd.Series(ratings, index=chunk.index).groupby(years).agg(['count', 'sum'])
+                yearly_totals = yearly if yearly_totals is None else yearly_totals.add(yearly, fill_value=0)
+            except Exception as e:
+                logger.warning("연도별 트렌드 집계 실패: %s", e)
+                trend_failed = True
+                yearly_totals = None
+        
+        del chunk
+    
+    # 기본 통계
+    average_rating = rating_sum / rating_count if rating_count else (np.nan if has_rating else 0)
+    negative, neutral, positive = (int(c) for c in sentiment_totals)
+    
+    # 감정 분석 (간단한 규칙)
+    if has_rating:
+        positive_ratio = (positive / total_reviews) * 100
+        negative_ratio = (negative / total_reviews) * 100
+        neutral_ratio = (neutral / total_reviews) * 100
+    else:
+        positive_ratio = negative_ratio = neutral_ratio = 0
+    
+    # 텍스트 데이터가 있는 경우 Aspect 분석 (언급 리뷰 수)
+    aspect_results = {}
+    if has_text:
+        aspect_results = {aspect: int(counts.sum()) for aspect, counts in zip(ASPECT_KEYWORDS, mention_totals)}
+    
+    # Aspect별 감정 분석
+    aspect_sentiment = {}
+    if has_text and has_rating:
+        for aspect, (negative_count, neutral_count, positive_count) in zip(ASPECT_KEYWORDS, mention_totals.tolist()):
+            mention_total = negative_count + neutral_count + positive_count
+            if mention_total > 0:
+                aspect_sentiment[aspect] = {
+                    'total': mention_total,
+                    'positive': positive_count,
+                    'negative': negative_count,
+                    'neutral': neutral_count,
+                    'positive_ratio': round((positive_count / mention_total) * 100, 1),
+                    'negative_ratio': round((negative_count / mention_total) * 100, 1),
+                    'neutral_ratio': round((neutral_count / mention_total) * 100, 1)
+                }
+    
+    # 개선사항 우선순위 점수 계산
+    priority_scores = {}
+    if aspect_results:
+        for aspect, mention_count in aspect_results.items():
+            if aspect in aspect_sentiment:
+                # 부정 비율이 높을수록 높은 점수 (우선순위)
+                negative_ratio = aspect_sentiment[aspect]['negative_ratio']
+                mention_weight = min(mention_count / 10, 1.0)  # 언급 횟수 가중치
+                priority_scores[aspect] = round(negative_ratio * mention_weight, 1)
+            else:
+                priority_scores[aspect] = 0.0
+    
+    # 우선순위 계산 (개선된 버전)
+    if priority_scores:
+        top_aspect = max(priority_scores, key=priority_scores.get)
+    elif aspect_results:
+        top_aspect = max(aspect_results, key=aspect_results.get)
+    else:
+        top_aspect = '분석 완료'
+    
+    # 차트 생성 (가능한 경우) - PNG 렌더링은 백그라운드 프로세스에서 수행
+    chart_files = {}
+    if _get_plot_generator() is not None:
+        try:
+            # 출력 디렉토리 설정
+            output_dir = session_folder / 'charts'
+            output_dir.mkdir(exist_ok=True)
+            
+            # 감정 분포 데이터
+            sentiment_data = None
+            if has_rating:
+                sentiment_data = {
+                    '긍정': positive,
+                    '부정': negative,
+                    '중립': neutral
+                }
+            
+            # 연도별 트렌드 데이터 (날짜 데이터가 있는 경우)
+            yearly_data = None
+            if yearly_totals is not None:
+                yearly_data = pd.DataFrame({
+                    '리뷰_수': yearly_totals['count'].astype(int),
+                    '평균_평점': yearly_totals['sum'] / yearly_totals['count']
+                }).round(2)
+            
+            # 부정 키워드 (상위 10개)
+            top_keywords = negative_keyword_counts.most_common(10) if has_text else []
+            
+            chart_files = _dispatch_charts(output_dir, sentiment_data, yearly_data, top_keywords)
+            
+        except Exception as e:
+            logger.error("차트 생성 중 오류: %s", e)
+    
+    return _summarize(total_reviews, average_rating, positive_ratio, negative_ratio, neutral_ratio,
+                      top_aspect, chart_files, aspect_sentiment, priority_scores)
 
 @app.route('/')
 def index():
@@ -71,11 +649,19 @@ def upload_file():
             session_folder.mkdir(exist_ok=True)
             
             # 파일 저장
-            filename = 'data.csv'
-            file_path = session_folder / filename
-            file.save(str(file_path))
+            file_path = session_folder / DATA_FILENAME
+            with open(file_path, 'wb', buffering=0) as dst:
+                shutil.copyfileobj(file.stream, dst, length=UPLOAD_CHUNK_SIZE)
             
-            logger.info(f"파일 저장 완료: {file_path}")
+            logger.info("파일 저장 완료: %s", file_path)
+            
+            # 분석 전에 헤더만 읽어 비정상 CSV 차단
+            try:
+                _probe_csv_header(file_path)
+            except ValueError as e:
+                shutil.rmtree(session_folder, ignore_errors=True)
+                flash(f'CSV 형식 오류: {e}', 'error')
+                return redirect(request.url)
             
             flash('파일이 성공적으로 업로드되었습니다.', 'success')
             return redirect(url_for('analyze', session_id=session_id))
@@ -84,455 +670,102 @@ def upload_file():
             return redirect(request.url)
             
     except Exception as e:
-        logger.error(f"파일 업로드 오류: {e}")
+        logger.error("파일 업로드 오류: %s", e)
         flash('파일 업로드 중 오류가 발생했습니다.', 'error')
         return redirect(request.url)
 
-@app.route('/analyze/<session_id>')
+@app.route('/analyze/<session_id:session_id>')
 def analyze(session_id):
     """분석 페이지"""
     return render_template('analyze.html', session_id=session_id)
 
-@app.route('/api/analyze/<session_id>', methods=['POST'])
+@app.route('/api/analyze/<session_id:session_id>', methods=['POST'])
 def start_analysis(session_id):
     """분석 API (간단 버전)"""
     try:
-        logger.info(f"분석 시작: {session_id}")
+        logger.info("분석 시작: %s", session_id)
         
         session_folder = UPLOAD_FOLDER / session_id
-        csv_file = session_folder / 'data.csv'
+        csv_file = session_folder / DATA_FILENAME
         
         if not csv_file.exists():
-            return jsonify({'error': 'CSV 파일을 찾을 수 없습니다.'}), 404
-        
-        # 간단한 데이터 분석
-        df = pd.read_csv(csv_file)
-        
-        # 기본 통계
-        total_reviews = len(df)
-        average_rating = df['평점'].mean() if '평점' in df.columns else 0
-        
-        # 감정 분석 (간단한 규칙)
-        if '평점' in df.columns:
-            positive = len(df[df['평점'] >= 8])
-            negative = len(df[df['평점'] <= 6])
-            neutral = total_reviews - positive - negative
-            
-            positive_ratio = (positive / total_reviews) * 100
-            negative_ratio = (negative / total_reviews) * 100
-            neutral_ratio = (neutral / total_reviews) * 100
-        else:
-            positive_ratio = negative_ratio = neutral_ratio = 0
-        
-        # Aspect 분석 (간단한 키워드 매칭)
-        aspect_keywords = {
-            '청결': ['청결', '깨끗', '더럽', '지저분', '먼지', '바닥', '청소', '깔끔', '위생'],
-            '시설/온수': ['시설', '온수', '샤워', '온도', '따뜻', '차갑', '잠금장치', '리모델링', '노후', '낡'],
-            '직원응대': ['직원', '응대', '서비스', '친절', '불친절', '태도', '안내', '프론트'],
-            '가격': ['가격', '비싸', '저렴', '가성비', '요금', '비용', '패키지', '강정', '조식'],
-            '온천수': ['온천', '탄산', '온천수', '탕', '사우나', '찜질방', '목욕', '온천욕']
-        }
-        
-        # 텍스트 데이터가 있는 경우 Aspect 분석
-        aspect_results = {}
-        if '내용' in df.columns:
-            for aspect, keywords in aspect_keywords.items():
-                mention_count = 0
-                for keyword in keywords:
-                    mention_count += df['내용'].str.contains(keyword, na=False).sum()
-                aspect_results[aspect] = mention_count
-        
-        # Aspect별 감정 분석
-        aspect_sentiment = {}
-        if '내용' in df.columns and '평점' in df.columns:
-            for aspect, keywords in aspect_keywords.items():
-                aspect_mentions = df[df['내용'].str.contains('|'.join(keywords), na=False)]
-                if len(aspect_mentions) > 0:
-                    positive_count = len(aspect_mentions[aspect_mentions['평점'] >= 8])
-                    negative_count = len(aspect_mentions[aspect_mentions['평점'] <= 6])
-                    neutral_count = len(aspect_mentions) - positive_count - negative_count
-                    
-                    aspect_sentiment[aspect] = {
-                        'total': len(aspect_mentions),
-                        'positive': positive_count,
-                        'negative': negative_count,
-                        'neutral': neutral_count,
-                        'positive_ratio': round((positive_count / len(aspect_mentions)) * 100, 1),
-                        'negative_ratio': round((negative_count / len(aspect_mentions)) * 100, 1),
-                        'neutral_ratio': round((neutral_count / len(aspect_mentions)) * 100, 1)
-                    }
-        
-        # 개선사항 우선순위 점수 계산
-        priority_scores = {}
-        if aspect_results:
-            for aspect, mention_count in aspect_results.items():
-                if aspect in aspect_sentiment:
-                    # 부정 비율이 높을수록 높은 점수 (우선순위)
-                    negative_ratio = aspect_sentiment[aspect]['negative_ratio']
-                    mention_weight = min(mention_count / 10, 1.0)  # 언급 횟수 가중치
-                    priority_scores[aspect] = round(negative_ratio * mention_weight, 1)
-                else:
-                    priority_scores[aspect] = 0.0
-        
-        # 우선순위 계산 (개선된 버전)
-        if priority_scores:
-            top_aspect = max(priority_scores.items(), key=lambda x: x[1])[0]
-        elif aspect_results:
-            top_aspect = max(aspect_results.items(), key=lambda x: x[1])[0]
-        else:
-            top_aspect = '분석 완료'
+            return jsonify_fast({'error': 'CSV 파일을 찾을 수 없습니다.'}, 404)
         
-        # 차트 생성 (가능한 경우)
-        chart_files = {}
-        if CHARTS_AVAILABLE:
-            try:
-                # 출력 디렉토리 설정
-                output_dir = session_folder / 'charts'
-                output_dir.mkdir(exist_ok=True)
-                
-                # PlotGenerator 초기화
-                plotter = PlotGenerator(output_dir)
-                
-                # 감정 분포 파이 차트 생성
-                sentiment_data = {
-                    '긍정': positive,
-                    '부정': negative,
-                    '중립': neutral
-                }
-                sentiment_chart = plotter.create_sentiment_pie_chart(sentiment_data)
-                if sentiment_chart:
-                    chart_files['sentiment'] = sentiment_chart
-                
-                # 연도별 트렌드 차트 (날짜 데이터가 있는 경우)
-                if '작성일자' in df.columns:
-                    try:
-                        df['날짜'] = pd.to_datetime(df['작성일자'])
-                        df['연도'] = df['날짜'].dt.year
-                        yearly_data = df.groupby('연도').agg({
-                            '평점': ['count', 'mean']
-                        }).round(2)
-                        yearly_data.columns = ['리뷰_수', '평균_평점']
-                        
-                        trend_chart = plotter.create_yearly_trend_plot(yearly_data)
-                        if trend_chart:
-                            chart_files['trend'] = trend_chart
-                    except Exception as e:
-                        logger.warning(f"연도별 트렌드 차트 생성 실패: {e}")
-                
-                # 부정 키워드 차트 (텍스트 데이터가 있는 경우)
-                if '내용' in df.columns:
-                    try:
-                        # 부정 키워드 분석
-                        negative_keywords = [
-                            '아쉽', '실망', '별로', '안좋', '나쁘', '불편', '문제', '결함', '고장',
-                            '부족', '떨어지', '낮', '안되', '못하', '싫', '짜증', '화나', '불쾌',
-                            '실종', '허', '늘어지', '떨어지', '낡', '오래', '노후', '지저분', '더럽',
-                            '차갑', '춥', '시끄럽', '소음', '비싸', '바가지', '불친절', '무시',
-                            '격양', '말문막힘', '아쉬워', '후회', '다시안갈', '추천안함'
-                        ]
-                        
-                        keyword_counts = []
-                        for keyword in negative_keywords:
-                            count = df['내용'].str.contains(keyword, na=False).sum()
-                            if count > 0:
-                                keyword_counts.append((keyword, count))
-                        
-                        # 상위 10개 키워드 선택
-                        keyword_counts.sort(key=lambda x: x[1], reverse=True)
-                        top_keywords = keyword_counts[:10]
-                        
-                        if top_keywords:
-                            keywords_chart = plotter.create_negative_keywords_bar(top_keywords)
-                            if keywords_chart:
-                                chart_files['keywords'] = keywords_chart
-                    except Exception as e:
-                        logger.warning(f"부정 키워드 차트 생성 실패: {e}")
-                
-                logger.info(f"차트 생성 완료: {list(chart_files.keys())}")
-                
-            except Exception as e:
-                logger.error(f"차트 생성 중 오류: {e}")
-        
-        summary = {
-            'total_reviews': total_reviews,
-            'average_rating': round(average_rating, 2),
-            'positive_ratio': round(positive_ratio, 1),
-            'negative_ratio': round(negative_ratio, 1),
-            'neutral_ratio': round(neutral_ratio, 1),
-            'top_priority': top_aspect,
-            'data_period': '성공',
-            'files': {
-                'html_report': None,
-                'pdf_report': None,
-                'pptx_summary': None
-            },
-            'charts': chart_files if CHARTS_AVAILABLE else {},
-            'aspect_sentiment': aspect_sentiment,
-            'priority_scores': priority_scores,
-            'key_insights': {
-                'overall_sentiment': '긍정' if positive_ratio > negative_ratio else '부정' if negative_ratio > positive_ratio else '중립',
-                'main_strength': max(aspect_sentiment.items(), key=lambda x: x[1]['positive_ratio'])[0] if aspect_sentiment else '분석 불가',
-                'main_weakness': max(aspect_sentiment.items(), key=lambda x: x[1]['negative_ratio'])[0] if aspect_sentiment else '분석 불가',
-                'improvement_potential': round((negative_ratio / 100) * total_reviews, 0) if negative_ratio > 0 else 0
-            },
-            'strategic_recommendations': {
-                'immediate_action': top_aspect,
-                'long_term_focus': '고객 만족도 향상' if negative_ratio > 30 else '서비스 품질 유지',
-                'priority_level': '높음' if negative_ratio > 40 else '중간' if negative_ratio > 20 else '낮음'
-            }
-        }
+        # 결과 페이지와 같은 캐시를 공유 (업로드 후 첫 요청에서만 분석 수행)
+        summary = _load_or_analyze(session_id, session_folder, csv_file)
         
-        logger.info(f"분석 완료: {session_id}")
+        logger.info("분석 완료: %s", session_id)
         
-        return jsonify({
+        return jsonify_fast({
             'success': True,
             'session_id': session_id,
             'summary': summary
         })
         
+    except ValueError as e:
+        logger.warning("분석 불가 CSV: %s", e)
+        return jsonify_fast({'error': str(e)}, 400)
     except Exception as e:
-        logger.error(f"분석 오류: {e}")
-        import traceback
-        logger.error(f"상세 오류: {traceback.format_exc()}")
-        return jsonify({'error': str(e)}), 500
+        logger.error("분석 오류: %s", e)
+        logger.error("상세 오류:", exc_info=True)
+        return jsonify_fast({'error': str(e)}, 500)
 
-@app.route('/results/<session_id>')
+@app.route('/results/<session_id:session_id>')
 def results(session_id):
     """결과 페이지 (간단 버전)"""
     try:
         session_folder = UPLOAD_FOLDER / session_id
-        csv_file = session_folder / 'data.csv'
+        csv_file = session_folder / DATA_FILENAME
         
         if not csv_file.exists():
             flash('업로드된 파일을 찾을 수 없습니다.', 'error')
             return redirect(url_for('index'))
         
-        # 간단한 분석 수행
-        df = pd.read_csv(csv_file)
-        total_reviews = len(df)
-        average_rating = df['평점'].mean() if '평점' in df.columns else 0
+        # 분석 결과보다 새로운 렌더링 페이지가 있으면 그대로 제공 (ETag 기반 304 응답)
+        cache_mtime = _fresh_cache_mtime(session_folder, csv_file)
+        page_file = session_folder / RESULTS_PAGE_FILE
+        if (cache_mtime is not None and not session.get('_flashes') and page_file.exists()
+                and cache_mtime <= page_file.stat().st_mtime_ns):
+            return send_from_directory(session_folder, RESULTS_PAGE_FILE,
+                                       mimetype='text/html', conditional=True)
         
-        if '평점' in df.columns:
-            positive = len(df[df['평점'] >= 8])
-            negative = len(df[df['평점'] <= 6])
-            neutral = total_reviews - positive - negative
-            
-            positive_ratio = (positive / total_reviews) * 100
-            negative_ratio = (negative / total_reviews) * 100
-            neutral_ratio = (neutral / total_reviews) * 100
-        else:
-            positive_ratio = negative_ratio = neutral_ratio = 0
-        
-        # Aspect 분석 (간단한 키워드 매칭)
-        aspect_keywords = {
-            '청결': ['청결', '깨끗', '더럽', '지저분', '먼지', '바닥', '청소', '깔끔', '위생'],
-            '시설/온수': ['시설', '온수', '샤워', '온도', '따뜻', '차갑', '잠금장치', '리모델링', '노후', '낡'],
-            '직원응대': ['직원', '응대', '서비스', '친절', '불친절', '태도', '안내', '프론트'],
-            '가격': ['가격', '비싸', '저렴', '가성비', '요금', '비용', '패키지', '강정', '조식'],
-            '온천수': ['온천', '탄산', '온천수', '탕', '사우나', '찜질방', '목욕', '온천욕']
-        }
-        
-        # 텍스트 데이터가 있는 경우 Aspect 분석
-        aspect_results = {}
-        if '내용' in df.columns:
-            for aspect, keywords in aspect_keywords.items():
-                mention_count = 0
-                for keyword in keywords:
-                    mention_count += df['내용'].str.contains(keyword, na=False).sum()
-                aspect_results[aspect] = mention_count
-        
-        # Aspect별 감정 분석
-        aspect_sentiment = {}
-        if '내용' in df.columns and '평점' in df.columns:
-            for aspect, keywords in aspect_keywords.items():
-                aspect_mentions = df[df['내용'].str.contains('|'.join(keywords), na=False)]
-                if len(aspect_mentions) > 0:
-                    positive_count = len(aspect_mentions[aspect_mentions['평점'] >= 8])
-                    negative_count = len(aspect_mentions[aspect_mentions['평점'] <= 6])
-                    neutral_count = len(aspect_mentions) - positive_count - negative_count
-                    
-                    aspect_sentiment[aspect] = {
-                        'total': len(aspect_mentions),
-                        'positive': positive_count,
-                        'negative': negative_count,
-                        'neutral': neutral_count,
-                        'positive_ratio': round((positive_count / len(aspect_mentions)) * 100, 1),
-                        'negative_ratio': round((negative_count / len(aspect_mentions)) * 100, 1),
-                        'neutral_ratio': round((neutral_count / len(aspect_mentions)) * 100, 1)
-                    }
-        
-        # 개선사항 우선순위 점수 계산
-        priority_scores = {}
-        if aspect_results:
-            for aspect, mention_count in aspect_results.items():
-                if aspect in aspect_sentiment:
-                    # 부정 비율이 높을수록 높은 점수 (우선순위)
-                    negative_ratio = aspect_sentiment[aspect]['negative_ratio']
-                    mention_weight = min(mention_count / 10, 1.0)  # 언급 횟수 가중치
-                    priority_scores[aspect] = round(negative_ratio * mention_weight, 1)
-                else:
-                    priority_scores[aspect] = 0.0
-        
-        # 우선순위 계산 (개선된 버전)
-        if priority_scores:
-            top_aspect = max(priority_scores.items(), key=lambda x: x[1])[0]
-        elif aspect_results:
-            top_aspect = max(aspect_results.items(), key=lambda x: x[1])[0]
-        else:
-            top_aspect = '분석 완료'
-        
-        # 차트 생성 (가능한 경우)
-        chart_files = {}
-        if CHARTS_AVAILABLE:
-            try:
-                # 출력 디렉토리 설정
-                output_dir = session_folder / 'charts'
-                output_dir.mkdir(exist_ok=True)
-                
-                # PlotGenerator 초기화
-                plotter = PlotGenerator(output_dir)
-                
-                # 감정 분포 파이 차트 생성
-                sentiment_data = {
-                    '긍정': positive,
-                    '부정': negative,
-                    '중립': neutral
-                }
-                sentiment_chart = plotter.create_sentiment_pie_chart(sentiment_data)
-                if sentiment_chart:
-                    chart_files['sentiment'] = sentiment_chart
-                
-                # 연도별 트렌드 차트 (날짜 데이터가 있는 경우)
-                if '작성일자' in df.columns:
-                    try:
-                        df['날짜'] = pd.to_datetime(df['작성일자'])
-                        df['연도'] = df['날짜'].dt.year
-                        yearly_data = df.groupby('연도').agg({
-                            '평점': ['count', 'mean']
-                        }).round(2)
-                        yearly_data.columns = ['리뷰_수', '평균_평점']
-                        
-                        trend_chart = plotter.create_yearly_trend_plot(yearly_data)
-                        if trend_chart:
-                            chart_files['trend'] = trend_chart
-                    except Exception as e:
-                        logger.warning(f"연도별 트렌드 차트 생성 실패: {e}")
-                
-                # 부정 키워드 차트 (텍스트 데이터가 있는 경우)
-                if '내용' in df.columns:
-                    try:
-                        # 부정 키워드 분석
-                        negative_keywords = [
-                            '아쉽', '실망', '별로', '안좋', '나쁘', '불편', '문제', '결함', '고장',
-                            '부족', '떨어지', '낮', '안되', '못하', '싫', '짜증', '화나', '불쾌',
-                            '실종', '허', '늘어지', '떨어지', '낡', '오래', '노후', '지저분', '더럽',
-                            '차갑', '춥', '시끄럽', '소음', '비싸', '바가지', '불친절', '무시',
-                            '격양', '말문막힘', '아쉬워', '후회', '다시안갈', '추천안함'
-                        ]
-                        
-                        keyword_counts = []
-                        for keyword in negative_keywords:
-                            count = df['내용'].str.contains(keyword, na=False).sum()
-                            if count > 0:
-                                keyword_counts.append((keyword, count))
-                        
-                        # 상위 10개 키워드 선택
-                        keyword_counts.sort(key=lambda x: x[1], reverse=True)
-                        top_keywords = keyword_counts[:10]
-                        
-                        if top_keywords:
-                            keywords_chart = plotter.create_negative_keywords_bar(top_keywords)
-                            if keywords_chart:
-                                chart_files['keywords'] = keywords_chart
-                    except Exception as e:
-                        logger.warning(f"부정 키워드 차트 생성 실패: {e}")
-                
-                logger.info(f"차트 생성 완료: {list(chart_files.keys())}")
-                
-            except Exception as e:
-                logger.error(f"차트 생성 중 오류: {e}")
-        
-        session_info = {
-            'session_id': session_id,
-            'created_at': datetime.now().isoformat(),
-            'summary': {
-                'total_reviews': total_reviews,
-                'average_rating': round(average_rating, 2),
-                'positive_ratio': positive_ratio,
-                'negative_ratio': negative_ratio,
-                'neutral_ratio': neutral_ratio,
-                'top_priority': top_aspect,
-                'data_period': '성공',
-                'files': {
-                    'html_report': None,
-                    'pdf_report': None,
-                    'pptx_summary': None
-                },
-                'charts': chart_files if CHARTS_AVAILABLE else {},
-                'aspect_sentiment': aspect_sentiment,
-                'priority_scores': priority_scores,
-                'key_insights': {
-                    'overall_sentiment': '긍정' if positive_ratio > negative_ratio else '부정' if negative_ratio > positive_ratio else '중립',
-                    'main_strength': max(aspect_sentiment.items(), key=lambda x: x[1]['positive_ratio'])[0] if aspect_sentiment else '분석 불가',
-                    'main_weakness': max(aspect_sentiment.items(), key=lambda x: x[1]['negative_ratio'])[0] if aspect_sentiment else '분석 불가',
-                    'improvement_potential': round((negative_ratio / 100) * total_reviews, 0) if negative_ratio > 0 else 0
-                },
-                'strategic_recommendations': {
-                    'immediate_action': top_aspect,
-                    'long_term_focus': '고객 만족도 향상' if negative_ratio > 30 else '서비스 품질 유지',
-                    'priority_level': '높음' if negative_ratio > 40 else '중간' if negative_ratio > 20 else '낮음'
-                }
-            },
-            'analysis_results': {
-                'KPI': {'총_리뷰_수': total_reviews},
-                '우선순위': {'상위_3개': []},
-                '고급분석': False
-            }
-        }
-        
-        return render_template('results.html', 
-                             session_info=session_info,
-                             session_id=session_id)
+        summary = _load_or_analyze(session_id, session_folder, csv_file)
+        return _render_results(session_id, summary)
         
     except Exception as e:
-        logger.error(f"결과 페이지 오류: {e}")
-        import traceback
-        logger.error(f"상세 오류: {traceback.format_exc()}")
+        logger.error("결과 페이지 오류: %s", e)
+        logger.error("상세 오류:", exc_info=True)
         flash('결과를 불러오는 중 오류가 발생했습니다.', 'error')
         return redirect(url_for('index'))
 
-@app.route('/api/plot/<session_id>/<plot_name>')
+@app.route('/api/plot/<session_id:session_id>/<plot_name>')
 def get_plot(session_id, plot_name):
     """그래프 이미지 제공"""
     try:
         session_folder = UPLOAD_FOLDER / session_id
         charts_folder = session_folder / 'charts'
         
-        # 차트 파일 경로 설정
-        chart_files = {
-            'sentiment': 'sentiment_distribution.png',
-            'trend': 'yearly_trend.png',
-            'keywords': 'negative_keywords.png'
-        }
-        
-        if plot_name not in chart_files:
-            return jsonify({'error': '지원하지 않는 차트 유형입니다.'}), 404
+        if plot_name not in CHART_FILENAMES:
+            return jsonify_fast({'error': '지원하지 않는 차트 유형입니다.'}, 404)
         
-        chart_file = charts_folder / chart_files[plot_name]
+        chart_file = charts_folder / CHART_FILENAMES[plot_name]
         
+        # 백그라운드 생성이 끝나기 전이면 404 (클라이언트가 재시도)
         if not chart_file.exists():
-            return jsonify({
+            return jsonify_fast({
                 'error': f'차트 파일을 찾을 수 없습니다: {plot_name}',
-                'available': list(chart_files.keys())
-            }), 404
+                'available': list(CHART_FILENAMES.keys())
+            }, 404)
         
-        return send_file(chart_file, mimetype='image/png')
+        # ETag/Last-Modified 기반 조건부 응답 (변경 없으면 304)
+        return send_from_directory(charts_folder, CHART_FILENAMES[plot_name], mimetype='image/png',
+                                   conditional=True, max_age=PLOT_CACHE_MAX_AGE)
         
     except Exception as e:
-        logger.error(f"이미지 제공 오류: {e}")
-        return jsonify({'error': '이미지를 불러오는 중 오류가 발생했습니다.'}), 500
+        logger.error("이미지 제공 오류: %s", e)
+        return jsonify_fast({'error': '이미지를 불러오는 중 오류가 발생했습니다.'}, 500)
 
-@app.route('/download/<session_id>/<file_type>')
+@app.route('/download/<session_id:session_id>/<file_type>')
 def download_file(session_id, file_type):
     """파일 다운로드 (간단 버전에서는 지원하지 않음)"""
     try:
@@ -545,7 +778,7 @@ def download_file(session_id, file_type):
             return redirect(url_for('results', session_id=session_id))
             
     except Exception as e:
-        logger.error(f"파일 다운로드 오류: {e}")
+        logger.error("파일 다운로드 오류: %s", e)
         flash('파일 다운로드 중 오류가 발생했습니다.', 'error')
         return redirect(url_for('results', session_id=session_id))
 
@@ -570,5 +803,7 @@ if __name__ == '__main__':
     port = int(os.environ.get('PORT', 5000))
     debug_mode = os.environ.get('FLASK_ENV') == 'development'
     
-    # 배포 환경에서는 0.0.0.0으로 바인딩
-    app.run(debug=debug_mode, host='0.0.0.0', port=port)
+    # 개발용 Werkzeug 서버 (운영 환경은 wsgi.py를 gunicorn gthread 워커로 실행)
+    if not debug_mode:
+        logger.warning("개발 서버로 실행 중입니다. 운영 환경에서는 'gunicorn wsgi:application'을 사용하세요.")
+    app.run(debug=debug_mode, host='0.0.0.0', port=port, threaded=True)
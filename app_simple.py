@@ -2,20 +2,26 @@
 오색그린야드호텔 리뷰 분석 웹 애플리케이션 (간단 버전)
 """
 import os
-import uuid
+import secrets
 import logging
 from datetime import datetime
 from pathlib import Path
 from flask import Flask, render_template, request, jsonify, send_file, flash, redirect, url_for
 import pandas as pd
+from werkzeug.routing import BaseConverter
 
 # Flask 앱 초기화
 app = Flask(__name__)
 app.secret_key = 'your-secret-key-here'
 
+class SessionIdConverter(BaseConverter):
+    """세션 ID URL 변환기 (token_urlsafe 22자, 기존 UUID hex/하이픈 형식 허용)"""
+    regex = r'(?:[A-Za-z0-9_-]{22}|[0-9a-f]{32}|[0-9a-f]{8}(?:-[0-9a-f]{4}){3}-[0-9a-f]{12})'
+
+app.url_map.converters['session_id'] = SessionIdConverter
+
 # 업로드 설정
 UPLOAD_FOLDER = Path('uploads')
-ALLOWED_EXTENSIONS = {'csv'}
 MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB 제한
 
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
@@ -30,12 +36,11 @@ logger = logging.getLogger(__name__)
 
 def allowed_file(filename):
     """파일 확장자 검증"""
-    return '.' in filename and \
-           filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+    return filename.lower().endswith('.csv')
 
 def generate_session_id():
     """세션 ID 생성"""
-    return str(uuid.uuid4())
+    return secrets.token_urlsafe(16)
 
 @app.route('/')
 def index():
@@ -79,12 +84,12 @@ def upload_file():
         flash('파일 업로드 중 오류가 발생했습니다.', 'error')
         return redirect(request.url)
 
-@app.route('/analyze/<session_id>')
+@app.route('/analyze/<session_id:session_id>')
 def analyze(session_id):
     """분석 페이지"""
     return render_template('analyze.html', session_id=session_id)
 
-@app.route('/api/analyze/<session_id>', methods=['POST'])
+@app.route('/api/analyze/<session_id:session_id>', methods=['POST'])
 def start_analysis(session_id):
     """분석 API (간단 버전)"""
     try:
@@ -142,7 +147,7 @@ def start_analysis(session_id):
         logger.error(f"분석 오류: {e}")
         return jsonify({'error': str(e)}), 500
 
-@app.route('/results/<session_id>')
+@app.route('/results/<session_id:session_id>')
 def results(session_id):
     """결과 페이지 (간단 버전)"""
     try:
@@ -223,5 +228,7 @@ if __name__ == '__main__':
     port = int(os.environ.get('PORT', 5000))
     debug_mode = os.environ.get('FLASK_ENV') == 'development'
     
-    # 배포 환경에서는 0.0.0.0으로 바인딩
-    app.run(debug=debug_mode, host='0.0.0.0', port=port)
+    # 개발용 Werkzeug 서버 (운영 환경은 wsgi.py를 gunicorn gthread 워커로 실행)
+    if not debug_mode:
+        logger.warning("개발 서버로 실행 중입니다. 운영 환경에서는 'gunicorn wsgi:application'을 사용하세요.")
+    app.run(debug=debug_mode, host='0.0.0.0', port=port, threaded=True)
@@ -5,8 +5,10 @@
 """
 import sys
 import logging
+import logging.handlers
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 # 프로젝트 루트를 Python 경로에 추가
 project_root = Path(__file__).parent
@@ -19,19 +21,29 @@ from src.plots import PlotGenerator
 from src.report import ReportGenerator
 from src.export import ExportGenerator
 
-# 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler(f'analysis_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log', encoding='utf-8')
-    ]
-)
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 logger = logging.getLogger(__name__)
 
+def setup_logging():
+    """로깅 설정 (파일 로그는 메모리에 모았다가 한 번에 기록, ERROR 이상은 즉시 기록)
+
+    spawn 작업 프로세스가 이 모듈을 다시 import해도 로그 파일이 생기지 않도록 main()에서만 호출
+    """
+    file_handler = logging.FileHandler(f'analysis_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log', encoding='utf-8')
+    file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    logging.basicConfig(
+        level=logging.INFO,
+        format=LOG_FORMAT,
+        handlers=[
+            logging.StreamHandler(sys.stdout),
+            logging.handlers.MemoryHandler(capacity=1024, flushLevel=logging.ERROR, target=file_handler)
+        ],
+        force=True  # import 중 logging.warning 호출로 생긴 기본 핸들러 교체
+    )
+
 def main():
     """메인 실행 함수"""
+    setup_logging()
     try:
         logger.info("=" * 60)
         logger.info("오색그린야드호텔 리뷰 분석 시작")
@@ -81,14 +93,18 @@ def main():
         report_file = report_generator.generate_report(analysis_results, plot_files)
         logger.info(f"✓ 상세 리포트 생성 완료: {Path(report_file).name}")
         
-        # 요약 리포트 생성
-        summary_file = report_generator.create_summary_report(analysis_results)
-        logger.info(f"✓ 요약 리포트 생성 완료: {Path(summary_file).name}")
-        
-        # 6. PDF 및 PPTX 리포트 생성
-        logger.info("6. PDF 및 PPTX 리포트 생성 중...")
+        # 6. PDF 및 PPTX 리포트는 백그라운드 스레드에서 생성 (요약 리포트 생성과 병행)
+        logger.info("6. PDF 및 PPTX 리포트 생성 중 (백그라운드)...")
         export_generator = ExportGenerator(report_file)
-        export_results = export_generator.generate_all_formats(analysis_results, plot_files)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            export_future = executor.submit(export_generator.generate_all_formats,
+                                            analysis_results, plot_files)
+            
+            # 요약 리포트 생성
+            summary_file = report_generator.create_summary_report(analysis_results)
+            logger.info(f"✓ 요약 리포트 생성 완료: {Path(summary_file).name}")
+            
+            export_results = export_future.result()
         
         if export_results['pdf']:
             logger.info(f"✓ PDF 리포트 생성 완료: {Path(export_results['pdf']).name}")
@@ -10,9 +10,15 @@ from pathlib import Path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-# 환경 변수 설정
-os.environ['FLASK_ENV'] = 'development'
-os.environ['FLASK_DEBUG'] = '1'
+# 디버그(자동 리로드) 모드는 FLASK_DEBUG=1일 때만 사용
+DEBUG = os.environ.get('FLASK_DEBUG') == '1'
+PORT = int(os.environ.get('PORT', 5000))
+
+try:
+    from waitress import serve
+    WAITRESS_AVAILABLE = True
+except ImportError:
+    WAITRESS_AVAILABLE = False
 
 if __name__ == '__main__':
     from app import app
@@ -20,12 +26,18 @@ if __name__ == '__main__':
     print("=" * 60)
     print("오색그린야드호텔 리뷰 분석 웹 애플리케이션")
     print("=" * 60)
-    print(f"서버 시작: http://localhost:5000")
+    print(f"서버 시작: http://localhost:{PORT}")
     print("종료하려면 Ctrl+C를 누르세요")
     print("=" * 60)
     
     try:
-        app.run(debug=True, host='0.0.0.0', port=5000)
+        if WAITRESS_AVAILABLE and not DEBUG:
+            # 멀티스레드 WSGI 서버 (요청을 동시에 처리)
+            serve(app, host='0.0.0.0', port=PORT, threads=8)
+        else:
+            if not WAITRESS_AVAILABLE:
+                print("waitress가 설치되지 않아 Flask 개발 서버로 실행합니다. (pip install waitress)")
+            app.run(debug=DEBUG, host='0.0.0.0', port=PORT, threaded=True)
     except KeyboardInterrupt:
         print("\n서버가 종료되었습니다.")
     except Exception as e:
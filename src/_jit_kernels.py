@@ -0,0 +1,179 @@
+"""
+Numba JIT 커널 모듈 - 대용량 텍스트 키워드 집계 가속 (numba 미설치 시 사용하지 않음)
+"""
+import numpy as np
+from typing import List, Sequence
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    prange = range
+    NUMBA_AVAILABLE = False
+
+
+def _encode(strings: Sequence[str]):
+    """문자열 목록을 하나의 UTF-8 바이트 버퍼와 오프셋 배열로 변환"""
+    encoded = [s.encode('utf-8') for s in strings]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(b) for b in encoded], out=offsets[1:])
+    buf = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+    return buf, offsets
+
+
+def _match_at(buf, pos, end, kw_buf, k_start, k_end):
+    """buf[pos:]가 키워드로 시작하는지 확인"""
+    length = k_end - k_start
+    if length == 0 or pos + length > end:
+        return False
+    for j in range(length):
+        if buf[pos + j] != kw_buf[k_start + j]:
+            return False
+    return True
+
+
+def _count_groups_kernel(buf, offsets, kw_buf, kw_offsets, group_offsets, prefix_table):
+    """행별/그룹별 키워드 매칭 횟수 (정규식 alternation과 같은 비중첩 최좌측 매칭)"""
+    n_rows = len(offsets) - 1
+    n_groups = len(group_offsets) - 1
+    out = np.zeros((n_rows, n_groups), dtype=np.int64)
+    for i in prange(n_rows):
+        start = offsets[i]
+        end = offsets[i + 1]
+        for g in range(n_groups):
+            count = 0
+            pos = start
+            while pos < end:
+                step = 1
+                # 앞 2바이트가 그룹 키워드의 접두사가 아니면 건너뜀
+                if pos + 1 < end and not prefix_table[g, buf[pos] * np.int64(256) + buf[pos + 1]]:
+                    pos += 1
+                    continue
+                for k in range(group_offsets[g], group_offsets[g + 1]):
+                    if _match_at(buf, pos, end, kw_buf, kw_offsets[k], kw_offsets[k + 1]):
+                        count += 1
+                        step = kw_offsets[k + 1] - kw_offsets[k]
+                        break
+                pos += step
+            out[i, g] = count
+    return out
+
+
+def _count_hits_kernel(buf, offsets, kw_buf, kw_offsets, prefix_table):
+    """행별/키워드별 매칭 횟수 (전체 키워드를 하나의 alternation으로 보고 최좌측 매칭)"""
+    n_rows = len(offsets) - 1
+    n_keywords = len(kw_offsets) - 1
+    out = np.zeros((n_rows, n_keywords), dtype=np.int32)
+    for i in prange(n_rows):
+        start = offsets[i]
+        end = offsets[i + 1]
+        pos = start
+        while pos < end:
+            step = 1
+            if pos + 1 < end and not prefix_table[0, buf[pos] * np.int64(256) + buf[pos + 1]]:
+                pos += 1
+                continue
+            for k in range(n_keywords):
+                if _match_at(buf, pos, end, kw_buf, kw_offsets[k], kw_offsets[k + 1]):
+                    out[i, k] += 1
+                    step = kw_offsets[k + 1] - kw_offsets[k]
+                    break
+            pos += step
+    return out
+
+
+def _presence_kernel(buf, offsets, kw_buf, kw_offsets):
+    """행별/키워드별 포함 여부 (겹치는 키워드도 각각 판정)"""
+    n_rows = len(offsets) - 1
+    n_keywords = len(kw_offsets) - 1
+    out = np.zeros((n_rows, n_keywords), dtype=np.bool_)
+    for i in prange(n_rows):
+        start = offsets[i]
+        end = offsets[i + 1]
+        for k in range(n_keywords):
+            k_start = kw_offsets[k]
+            k_end = kw_offsets[k + 1]
+            if k_end == k_start:
+                continue
+            first = kw_buf[k_start]
+            for pos in range(start, end - (k_end - k_start) + 1):
+                if buf[pos] == first and _match_at(buf, pos, end, kw_buf, k_start, k_end):
+                    out[i, k] = True
+                    break
+    return out
+
+
+def _masked_stats_kernel(masks, codes, ratings, n_labels):
+    """그룹(마스크)별 라벨 코드 빈도와 NaN을 제외한 평점 합계/개수를 한 번의 순회로 집계"""
+    n_groups, n_rows = masks.shape
+    label_counts = np.zeros((n_groups, n_labels), dtype=np.int64)
+    rating_sums = np.zeros(n_groups, dtype=np.float64)
+    rating_counts = np.zeros(n_groups, dtype=np.int64)
+    for g in prange(n_groups):
+        for i in range(n_rows):
+            if masks[g, i]:
+                label_counts[g, codes[i]] += 1
+                rating = ratings[i]
+                if not np.isnan(rating):
+                    rating_sums[g] += rating
+                    rating_counts[g] += 1
+    return label_counts, rating_sums, rating_counts
+
+
+if NUMBA_AVAILABLE:
+    _match_at = njit(cache=True, nogil=True)(_match_at)
+    _count_groups_kernel = njit(parallel=True, cache=True, nogil=True)(_count_groups_kernel)
+    _count_hits_kernel = njit(parallel=True, cache=True, nogil=True)(_count_hits_kernel)
+    _presence_kernel = njit(parallel=True, cache=True, nogil=True)(_presence_kernel)
+    _masked_stats_kernel = njit(parallel=True, cache=True, nogil=True)(_masked_stats_kernel)
+
+
+def _prefix_table(kw_buf, kw_offsets, group_offsets):
+    """그룹별 키워드 앞 2바이트 존재 여부 테이블 (불일치 위치 건너뛰기용)"""
+    n_groups = len(group_offsets) - 1
+    prefix_table = np.zeros((n_groups, 65536), dtype=np.bool_)
+    for g in range(n_groups):
+        for k in range(group_offsets[g], group_offsets[g + 1]):
+            kw = kw_buf[kw_offsets[k]:kw_offsets[k + 1]]
+            if len(kw) >= 2:
+                prefix_table[g, int(kw[0]) * 256 + int(kw[1])] = True
+            elif len(kw) == 1:
+                prefix_table[g, int(kw[0]) * 256:int(kw[0]) * 256 + 256] = True
+    return prefix_table
+
+
+def count_keyword_groups(texts: Sequence[str], groups: Sequence[Sequence[str]]) -> np.ndarray:
+    """텍스트별 키워드 그룹 매칭 횟수 행렬 (n_texts, n_groups) 반환"""
+    buf, offsets = _encode(texts)
+    keywords: List[str] = [kw for group in groups for kw in group]
+    kw_buf, kw_offsets = _encode(keywords)
+    group_offsets = np.zeros(len(groups) + 1, dtype=np.int64)
+    np.cumsum([len(group) for group in groups], out=group_offsets[1:])
+    prefix_table = _prefix_table(kw_buf, kw_offsets, group_offsets)
+    return _count_groups_kernel(buf, offsets, kw_buf, kw_offsets, group_offsets, prefix_table)
+
+
+def count_keyword_hits(texts: Sequence[str], keywords: Sequence[str]) -> np.ndarray:
+    """키워드별 전체 매칭 횟수 (n_keywords,) 반환 (정규식 (kw1|kw2|...) findall과 동일한 분할)"""
+    buf, offsets = _encode(texts)
+    kw_buf, kw_offsets = _encode(keywords)
+    group_offsets = np.array([0, len(keywords)], dtype=np.int64)
+    prefix_table = _prefix_table(kw_buf, kw_offsets, group_offsets)
+    return _count_hits_kernel(buf, offsets, kw_buf, kw_offsets, prefix_table).sum(axis=0, dtype=np.int64)
+
+
+def keyword_presence(texts: Sequence[str], keywords: Sequence[str]) -> np.ndarray:
+    """텍스트별 키워드 포함 여부 행렬 (n_texts, n_keywords) 반환 (`kw in text`와 동일)"""
+    buf, offsets = _encode(texts)
+    kw_buf, kw_offsets = _encode(keywords)
+    return _presence_kernel(buf, offsets, kw_buf, kw_offsets)
+
+
+def masked_group_stats(masks: np.ndarray, codes: np.ndarray, ratings: np.ndarray, n_labels: int):
+    """(n_groups, n_rows) 마스크별 매칭 수, 라벨별 빈도 (n_groups, n_labels), 평균 평점(NaN 제외) 반환"""
+    label_counts, rating_sums, rating_counts = _masked_stats_kernel(
+        np.ascontiguousarray(masks, dtype=np.bool_), codes, ratings, n_labels
+    )
+    with np.errstate(invalid='ignore', divide='ignore'):
+        means = rating_sums / rating_counts
+    return label_counts.sum(axis=1), label_counts, means
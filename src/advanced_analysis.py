@@ -3,19 +3,25 @@
 """
 import pandas as pd
 import numpy as np
-import re
+import copy
+import os
+import hashlib
 import logging
+import threading
+from collections import Counter, OrderedDict
+from functools import wraps
 from typing import Dict, List, Tuple, Any, Optional
 from pathlib import Path
 
 # 머신러닝 라이브러리
-from sklearn.feature_extraction.text import TfidfVectorizer, CountVectorizer
+from sklearn.feature_extraction.text import TfidfVectorizer, HashingVectorizer, TfidfTransformer
 from sklearn.linear_model import LinearRegression, Ridge
 from sklearn.ensemble import RandomForestRegressor
-from sklearn.model_selection import train_test_split, cross_val_score
-from sklearn.metrics import mean_squared_error, r2_score
-from sklearn.decomposition import NMF, LatentDirichletAllocation
-from sklearn.preprocessing import StandardScaler
+from sklearn.base import clone
+from sklearn.model_selection import KFold, cross_validate
+from sklearn.decomposition import NMF, MiniBatchNMF
+from sklearn.utils import murmurhash3_32
+import joblib
 
 # 고급 분석 라이브러리
 try:
@@ -33,77 +39,223 @@ except ImportError:
     logging.warning("ruptures 라이브러리가 설치되지 않았습니다. 변화점 탐지를 건너뜁니다.")
 
 try:
-    from sentence_transformers import SentenceTransformer
-    SENTENCE_TRANSFORMERS_AVAILABLE = True
+    import lightgbm as lgb
+    LIGHTGBM_AVAILABLE = True
 except ImportError:
-    SENTENCE_TRANSFORMERS_AVAILABLE = False
-    logging.warning("sentence-transformers 라이브러리가 설치되지 않았습니다. BERT 임베딩을 건너뜁니다.")
+    LIGHTGBM_AVAILABLE = False
 
-from .config import ANALYSIS_OPTIONS
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+from .config import ANALYSIS_OPTIONS, CACHE_DIR
+from ._jit_kernels import NUMBA_AVAILABLE, keyword_presence
 
 logger = logging.getLogger(__name__)
 
+# 평점 예측용 키워드 특성 (그룹별로 텍스트에 포함된 키워드 종류 수를 셈)
+FEATURE_KEYWORD_GROUPS = {
+    '청결_키워드_수': ("청결", "깨끗", "더럽", "지저분", "먼지", "바닥", "청소", "깔끔", "위생"),
+    '시설_키워드_수': ("시설", "온수", "샤워", "온도", "따뜻", "차갑", "잠금장치", "리모델링", "노후", "낡"),
+    '직원_키워드_수': ("직원", "응대", "서비스", "친절", "불친절", "태도", "안내", "프론트"),
+    '가격_키워드_수': ("가격", "비싸", "저렴", "가성비", "요금", "비용", "패키지"),
+    '온천_키워드_수': ("온천", "탄산", "온천수", "탕", "사우나", "찜질방", "목욕", "온천욕"),
+    '부정_키워드_수': (
+        "아쉽", "실망", "별로", "안좋", "나쁘", "불편", "문제", "결함", "고장",
+        "부족", "떨어지", "낮", "안되", "못하", "싫", "짜증", "화나", "불쾌"
+    ),
+    '긍정_키워드_수': (
+        "좋", "만족", "훌륭", "최고", "추천", "완벽", "완전", "대박", "최상",
+        "감동", "감사", "사랑", "즐거", "행복", "편안", "안락", "훌륭"
+    )
+}
+
+
+def _build_keyword_index(groups: Dict[str, Tuple[str, ...]]) -> Tuple[List[str], np.ndarray]:
+    """그룹 키워드를 고유 키워드 목록과 (키워드 x 그룹) 가중치 행렬로 변환"""
+    keywords = list(dict.fromkeys(kw for group in groups.values() for kw in group))
+    position = {kw: idx for idx, kw in enumerate(keywords)}
+    weights = np.zeros((len(keywords), len(groups)), dtype=np.int32)
+    for group_idx, group in enumerate(groups.values()):
+        for kw in group:
+            # 그룹 안에 중복된 키워드는 기존처럼 중복 횟수만큼 셈
+            weights[position[kw], group_idx] += 1
+    return keywords, weights
+
+
+def _build_keyword_automaton(keywords: List[str]):
+    """전체 키워드를 하나의 Aho-Corasick 오토마톤으로 생성 (pyahocorasick 설치 시)"""
+    if not AHOCORASICK_AVAILABLE:
+        return None
+    automaton = ahocorasick.Automaton()
+    for idx, kw in enumerate(keywords):
+        automaton.add_word(kw, idx)
+    automaton.make_automaton()
+    return automaton
+
+
+NUMBA_MIN_TEXTS = 20_000  # 이 텍스트 수 이상이면 Numba 커널로 키워드 포함 여부 계산
+_FEATURE_KEYWORDS, _FEATURE_GROUP_WEIGHTS = _build_keyword_index(FEATURE_KEYWORD_GROUPS)
+_FEATURE_AUTOMATON = _build_keyword_automaton(_FEATURE_KEYWORDS)
+
+def _keyword_group_counts(texts: np.ndarray) -> np.ndarray:
+    """텍스트별/그룹별 포함 키워드 종류 수 (n_texts, n_groups)"""
+    if _FEATURE_AUTOMATON is not None:
+        # 모든 그룹의 키워드를 텍스트당 한 번의 순회로 매칭 (겹치는 매칭 포함)
+        presence = np.zeros((len(texts), len(_FEATURE_KEYWORDS)), dtype=np.int32)
+        for row, text in enumerate(texts):
+            for _, kw_idx in _FEATURE_AUTOMATON.iter(text):
+                presence[row, kw_idx] = 1
+        return presence @ _FEATURE_GROUP_WEIGHTS
+    if NUMBA_AVAILABLE and len(texts) >= NUMBA_MIN_TEXTS:
+        # 텍스트 행 단위 병렬 부분 문자열 검색 (Numba JIT)
+        presence = keyword_presence(texts.tolist(), _FEATURE_KEYWORDS)
+        return presence.astype(np.int32) @ _FEATURE_GROUP_WEIGHTS
+    # 키워드별로 평탄한 텍스트 배열을 한 번씩 검사 (str의 C 부분 문자열 검색)
+    presence = np.empty((len(texts), len(_FEATURE_KEYWORDS)), dtype=np.int32)
+    for kw_idx, kw in enumerate(_FEATURE_KEYWORDS):
+        presence[:, kw_idx] = np.fromiter((kw in text for text in texts), dtype=bool, count=len(texts))
+    return presence @ _FEATURE_GROUP_WEIGHTS
+
+
+def _fit_and_evaluate(name: str, model, feature_columns: List[str], X, y, folds) -> Dict[str, Any]:
+    """교차검증으로 성능을 평가하고, 전체 데이터로 다시 학습한 모델과 특성 중요도를 반환"""
+    logger.info(f"{name} 모델 학습 중...")
+    
+    # 성능은 폴드별 검증 점수의 평균/표준편차로만 보고 (특정 폴드 모델을 고르지 않음)
+    # 병렬화는 폴드 단위로만 하고 각 추정기는 단일 스레드로 학습 (과다 구독 방지)
+    cv = cross_validate(
+        model, X, y, cv=folds, scoring=['r2', 'neg_mean_squared_error'], n_jobs=-1
+    )
+    r2_scores = cv['test_r2']
+    mse_scores = -cv['test_neg_mean_squared_error']
+    
+    # SHAP/특성 중요도에 쓸 모델은 전체 데이터로 학습 (이때는 추정기 내부 병렬화 사용)
+    model = clone(model)
+    if 'n_jobs' in model.get_params():
+        model.set_params(n_jobs=-1)
+    model.fit(X, y)
+    
+    result = {
+        'model': model,
+        'cv': {
+            'n_splits': len(folds),
+            'r2_mean': r2_scores.mean(),
+            'r2_std': r2_scores.std(),
+            'mse_mean': mse_scores.mean(),
+            'mse_std': mse_scores.std()
+        },
+        'feature_importance': None
+    }
+    
+    # 특성 중요도 계산
+    if hasattr(model, 'feature_importances_'):
+        result['feature_importance'] = dict(zip(feature_columns, model.feature_importances_))
+    elif hasattr(model, 'coef_'):
+        result['feature_importance'] = dict(zip(feature_columns, np.abs(model.coef_)))
+    
+    return result
+
+
+# 토픽 모델링: 이 문서 수 이상이면 어휘 사전 대신 해싱 벡터화 사용 (메모리 절감)
+TOPIC_HASHING_MIN_DOCS = 50_000
+TOPIC_HASHING_FEATURES = 2 ** 14
+TOPIC_TERM_SAMPLE_DOCS = 20_000  # 해시 컬럼을 단어로 복원할 때 다시 토큰화할 최대 문서 수
+# 이 문서 수 이상이면 전체 행렬 대신 미니배치로 NMF 학습
+TOPIC_MINIBATCH_MIN_DOCS = 50_000
+TOPIC_MODEL_CACHE_VERSION = 3  # 캐시 파일 형식이나 학습 코드가 바뀌면 올려서 디스크 캐시 무효화
+TOPIC_MODEL_CACHE_MAX_FILES = 8  # 최근 사용한 토픽 모델 캐시만 남기고 나머지는 삭제
+
+# 데이터 내용 해시 기준 분석 결과 캐시 (같은 데이터를 다시 분석하면 재사용)
+RESULT_CACHE_SIZE = 16
+_RESULT_CACHE: "OrderedDict[tuple, Any]" = OrderedDict()
+_RESULT_CACHE_LOCK = threading.Lock()
+
+
+def _cached_by_data(method):
+    """self.df 내용과 고급 분석 옵션이 같으면 이전 결과를 반환하는 데코레이터"""
+    @wraps(method)
+    def wrapper(self):
+        key = (method.__name__,) + self._data_key()
+        with _RESULT_CACHE_LOCK:
+            result = _RESULT_CACHE.get(key)
+            if result is not None:
+                _RESULT_CACHE.move_to_end(key)
+        if result is None:
+            result = method(self)
+            with _RESULT_CACHE_LOCK:
+                _RESULT_CACHE[key] = result
+                if len(_RESULT_CACHE) > RESULT_CACHE_SIZE:
+                    _RESULT_CACHE.popitem(last=False)
+        else:
+            logger.info(f"{method.__name__}: 캐시된 결과 사용")
+        # 결과는 dict 안에 DataFrame/배열/모델이 중첩되어 있으므로 깊은 복사본을 반환
+        # (호출자가 결과를 수정해도 캐시 원본이 바뀌지 않도록)
+        return copy.deepcopy(result)
+    return wrapper
+
+
 class AdvancedAnalyzer:
     """고급 분석 클래스"""
     
     def __init__(self, df: pd.DataFrame):
-        self.df = df.copy()
+        # 분석 대상 DataFrame은 읽기 전용으로 사용 (복사하지 않음)
+        self.df = df
         self.advanced_options = ANALYSIS_OPTIONS.get('advanced_analysis', {})
-        
+        self._cache_key = None
+        self._texts = None
+    
+    def _data_key(self) -> tuple:
+        """데이터 내용 해시와 분석 옵션으로 구성된 캐시 키"""
+        if self._cache_key is None:
+            data_hash = int(pd.util.hash_pandas_object(self.df, index=True).sum())
+            self._cache_key = (
+                self.df.shape, tuple(self.df.columns), tuple(map(str, self.df.dtypes)), data_hash,
+                tuple(sorted(self.advanced_options.items()))
+            )
+        return self._cache_key
+    
+    def _text_array(self) -> np.ndarray:
+        """통합 텍스트를 한 번만 object 배열로 변환 (특성 생성과 토픽 모델링에서 공유)"""
+        if self._texts is None:
+            self._texts = self.df['통합_텍스트'].fillna('').astype(str).to_numpy(dtype=object)
+        return self._texts
+    
+    @_cached_by_data
     def create_features(self) -> pd.DataFrame:
         """평점 예측을 위한 특성을 생성합니다."""
         logger.info("평점 예측용 특성 생성 시작")
         
-        # 기본 특성
-        features_df = self.df.copy()
+        df = self.df
+        features = {}
         
         # 텍스트 길이 특성
-        features_df['제목_길이'] = features_df['제목'].astype(str).str.len()
-        features_df['내용_길이'] = features_df['내용'].astype(str).str.len()
-        features_df['평가_길이'] = features_df['평가'].astype(str).str.len()
-        features_df['총_텍스트_길이'] = features_df['제목_길이'] + features_df['내용_길이'] + features_df['평가_길이']
-        
-        # 시간 관련 특성
-        features_df['연도'] = features_df['작성일자'].dt.year
-        features_df['월'] = features_df['작성일자'].dt.month
-        features_df['분기'] = features_df['작성일자'].dt.quarter
-        features_df['요일'] = features_df['작성일자'].dt.dayofweek
-        
-        # Aspect 키워드 특성
-        aspect_keywords = {
-            "청결": ["청결", "깨끗", "더럽", "지저분", "먼지", "바닥", "청소", "깔끔", "위생"],
-            "시설": ["시설", "온수", "샤워", "온도", "따뜻", "차갑", "잠금장치", "리모델링", "노후", "낡"],
-            "직원": ["직원", "응대", "서비스", "친절", "불친절", "태도", "안내", "프론트"],
-            "가격": ["가격", "비싸", "저렴", "가성비", "요금", "비용", "패키지"],
-            "온천": ["온천", "탄산", "온천수", "탕", "사우나", "찜질방", "목욕", "온천욕"]
-        }
-        
-        for aspect, keywords in aspect_keywords.items():
-            features_df[f'{aspect}_키워드_수'] = features_df['통합_텍스트'].apply(
-                lambda text: sum(1 for keyword in keywords if keyword in text)
-            )
-        
-        # 부정 키워드 특성
-        negative_keywords = [
-            "아쉽", "실망", "별로", "안좋", "나쁘", "불편", "문제", "결함", "고장",
-            "부족", "떨어지", "낮", "안되", "못하", "싫", "짜증", "화나", "불쾌"
-        ]
-        features_df['부정_키워드_수'] = features_df['통합_텍스트'].apply(
-            lambda text: sum(1 for keyword in negative_keywords if keyword in text)
-        )
-        
-        # 긍정 키워드 특성
-        positive_keywords = [
-            "좋", "만족", "훌륭", "최고", "추천", "완벽", "완전", "대박", "최상",
-            "감동", "감사", "사랑", "즐거", "행복", "편안", "안락", "훌륭"
-        ]
-        features_df['긍정_키워드_수'] = features_df['통합_텍스트'].apply(
-            lambda text: sum(1 for keyword in positive_keywords if keyword in text)
-        )
+        features['제목_길이'] = df['제목'].astype(str).str.len()
+        features['내용_길이'] = df['내용'].astype(str).str.len()
+        features['평가_길이'] = df['평가'].astype(str).str.len()
+        features['총_텍스트_길이'] = features['제목_길이'] + features['내용_길이'] + features['평가_길이']
+        
+        # 시간 관련 특성 (분기는 타임스탬프를 다시 해석하지 않고 월에서 계산)
+        dates = df['작성일자'].dt
+        features['연도'] = dates.year
+        features['월'] = dates.month
+        features['분기'] = (features['월'] - 1) // 3 + 1
+        features['요일'] = dates.dayofweek
+        
+        # Aspect/부정/긍정 키워드 특성 (전체 그룹을 한 번에 매칭한 뒤 그룹별로 합산)
+        keyword_counts = _keyword_group_counts(self._text_array())
+        for group_idx, column in enumerate(FEATURE_KEYWORD_GROUPS):
+            features[column] = keyword_counts[:, group_idx]
         
         # 감정 비율 특성
-        features_df['긍정_비율'] = features_df['긍정_키워드_수'] / (features_df['긍정_키워드_수'] + features_df['부정_키워드_수'] + 1)
-        features_df['부정_비율'] = features_df['부정_키워드_수'] / (features_df['긍정_키워드_수'] + features_df['부정_키워드_수'] + 1)
+        keyword_total = features['긍정_키워드_수'] + features['부정_키워드_수'] + 1
+        features['긍정_비율'] = features['긍정_키워드_수'] / keyword_total
+        features['부정_비율'] = features['부정_키워드_수'] / keyword_total
+        
+        # 원본 컬럼은 복사하지 않고 (Copy-on-Write) 파생 특성만 추가한 새 DataFrame 반환
+        features_df = df.assign(**features)
         
         logger.info("평점 예측용 특성 생성 완료")
         return features_df
@@ -120,60 +272,60 @@ class AdvancedAnalyzer:
             '부정_키워드_수', '긍정_키워드_수', '긍정_비율', '부정_비율'
         ]
         
-        X = features_df[feature_columns].fillna(0)
-        y = features_df['평점']
+        # float32로 변환해 학습 시 메모리 이동량 절감
+        X = features_df[feature_columns].fillna(0).astype(np.float32)
+        y = features_df['평점'].astype(np.float32)
         
-        # 데이터 분할
-        X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+        # 교차검증 폴드 (모든 모델이 같은 무작위 분할을 사용)
+        folds = list(KFold(n_splits=5, shuffle=True, random_state=42).split(X))
         
-        # 모델 학습
+        # 모델 학습 (트리 모델은 LightGBM이 설치되어 있으면 LightGBM, 아니면 Random Forest)
         models = {
             'Linear Regression': LinearRegression(),
-            'Ridge Regression': Ridge(alpha=1.0),
-            'Random Forest': RandomForestRegressor(n_estimators=100, random_state=42)
+            'Ridge Regression': Ridge(alpha=1.0)
         }
+        if LIGHTGBM_AVAILABLE:
+            tree_model_name = 'LightGBM'
+            models[tree_model_name] = lgb.LGBMRegressor(
+                n_estimators=200, num_leaves=31, n_jobs=1, random_state=42, verbose=-1
+            )
+        else:
+            tree_model_name = 'Random Forest'
+            models[tree_model_name] = RandomForestRegressor(n_estimators=100, random_state=42, n_jobs=1)
         
-        results = {}
         shap_values = None
         
-        for name, model in models.items():
-            logger.info(f"{name} 모델 학습 중...")
-            
-            # 모델 학습
-            model.fit(X_train, y_train)
-            
-            # 예측
-            y_pred = model.predict(X_test)
-            
-            # 성능 평가
-            mse = mean_squared_error(y_test, y_pred)
-            r2 = r2_score(y_test, y_pred)
-            cv_scores = cross_val_score(model, X, y, cv=5, scoring='r2')
-            
-            results[name] = {
-                'model': model,
-                'mse': mse,
-                'r2': r2,
-                'cv_mean': cv_scores.mean(),
-                'cv_std': cv_scores.std(),
-                'feature_importance': None
-            }
-            
-            # 특성 중요도 계산
-            if hasattr(model, 'feature_importances_'):
-                results[name]['feature_importance'] = dict(zip(feature_columns, model.feature_importances_))
-            elif hasattr(model, 'coef_'):
-                results[name]['feature_importance'] = dict(zip(feature_columns, np.abs(model.coef_)))
-        
-        # SHAP 분석 (Random Forest 모델에 대해)
-        if SHAP_AVAILABLE and 'Random Forest' in results:
+        # 모델은 순서대로 학습 (병렬화는 교차검증 폴드 한 단계에서만)
+        results = {
+            name: _fit_and_evaluate(name, model, feature_columns, X, y, folds)
+            for name, model in models.items()
+        }
+        
+        # SHAP 분석 (트리 모델에 대해, LightGBM은 내장 기여도 계산 사용)
+        # 전체 데이터로 학습한 모델을 설명
+        tree_model = results[tree_model_name]['model']
+        X_shap = X
+        
+        # SHAP 계산량은 행 수에 비례하므로 일부 행만 샘플링해서 설명
+        shap_sample_size = self.advanced_options.get('shap_sample_size', 200)
+        if len(X_shap) > shap_sample_size:
+            sample_idx = np.random.RandomState(0).choice(len(X_shap), size=shap_sample_size, replace=False)
+            X_shap = X_shap.iloc[np.sort(sample_idx)]
+        
+        if not self.advanced_options.get('enable_shap', True):
+            logger.info("SHAP 분석 비활성화")
+        elif LIGHTGBM_AVAILABLE:
+            logger.info("SHAP 분석 시작 (LightGBM pred_contrib)")
+            # 마지막 열은 기댓값(bias)
+            shap_values = tree_model.predict(X_shap, pred_contrib=True)[:, :-1]
+        elif SHAP_AVAILABLE:
             logger.info("SHAP 분석 시작")
-            rf_model = results['Random Forest']['model']
-            explainer = shap.TreeExplainer(rf_model)
-            shap_values = explainer.shap_values(X_test)
-            
+            explainer = shap.TreeExplainer(tree_model)
+            shap_values = explainer.shap_values(X_shap)
+        
+        if shap_values is not None:
             # 상위 특성 추출
-            feature_importance = results['Random Forest']['feature_importance']
+            feature_importance = results[tree_model_name]['feature_importance']
             top_features = sorted(feature_importance.items(), key=lambda x: x[1], reverse=True)
             top_features = top_features[:self.advanced_options.get('shap_top_features', 10)]
             
@@ -186,12 +338,13 @@ class AdvancedAnalyzer:
         logger.info("평점 예측 모델 학습 완료")
         return results
     
+    @_cached_by_data
     def perform_topic_modeling(self) -> Dict[str, Any]:
         """토픽 모델링을 수행합니다."""
         logger.info("토픽 모델링 시작")
         
         # 텍스트 전처리
-        texts = self.df['통합_텍스트'].fillna('').astype(str)
+        texts = self._text_array()
         
         # 불용어 정의
         stop_words = [
@@ -200,22 +353,9 @@ class AdvancedAnalyzer:
             '있다', '있다', '있다', '있다', '있다', '있다', '있다', '있다'
         ]
         
-        # TF-IDF 벡터화
-        tfidf_vectorizer = TfidfVectorizer(
-            max_features=1000,
-            stop_words=stop_words,
-            min_df=2,
-            max_df=0.95,
-            ngram_range=(1, 2)
-        )
-        
-        tfidf_matrix = tfidf_vectorizer.fit_transform(texts)
-        feature_names = tfidf_vectorizer.get_feature_names_out()
-        
-        # NMF 토픽 모델링
+        # 같은 코퍼스로 학습한 모델이 디스크에 있으면 재사용
         n_topics = self.advanced_options.get('topic_count', 8)
-        nmf = NMF(n_components=n_topics, random_state=42, max_iter=200)
-        nmf.fit(tfidf_matrix)
+        tfidf_matrix, feature_names, nmf = self._load_or_fit_topic_model(texts, stop_words, n_topics)
         
         # 토픽 추출
         topics = []
@@ -245,21 +385,142 @@ class AdvancedAnalyzer:
         logger.info("토픽 모델링 완료")
         return results
     
-    def _calculate_yearly_topic_distribution(self, doc_topics: np.ndarray) -> pd.DataFrame:
-        """연도별 토픽 분포를 계산합니다."""
-        yearly_dist = []
+    def _load_or_fit_topic_model(self, texts: np.ndarray, stop_words: List[str],
+                                 n_topics: int) -> Tuple[Any, np.ndarray, Any]:
+        """코퍼스와 벡터화/NMF 설정 해시로 저장된 TF-IDF 행렬/단어/NMF 모델을 로드하거나 새로 학습합니다."""
+        estimators = self._build_topic_estimators(len(texts), stop_words, n_topics)
+        
+        # 캐시 키: 캐시 버전 + 코퍼스 + 각 추정기의 전체 파라미터
+        cache_hash = hashlib.sha1(usedforsecurity=False)
+        cache_hash.update(f"v{TOPIC_MODEL_CACHE_VERSION}".encode('utf-8'))
+        for estimator in filter(None, estimators):
+            params = sorted(estimator.get_params().items())
+            cache_hash.update(repr((type(estimator).__name__, params)).encode('utf-8'))
+        for text in texts:
+            cache_hash.update(text.encode('utf-8'))
+            cache_hash.update(b'\0')
+        cache_file = CACHE_DIR / f"topic_v{TOPIC_MODEL_CACHE_VERSION}_{cache_hash.hexdigest()[:16]}.joblib"
+        
+        if cache_file.exists():
+            try:
+                logger.info(f"저장된 토픽 모델 사용: {cache_file.name}")
+                cached = joblib.load(cache_file)
+                os.utime(cache_file)  # 최근 사용 시각 갱신 (정리 시 보존)
+                return cached
+            except Exception as e:
+                logger.warning(f"토픽 모델 캐시 로드 실패, 다시 학습합니다: {e}")
+        
+        tfidf_matrix, feature_names, nmf = self._fit_topic_model(texts, *estimators)
+        
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix(f'.{os.getpid()}.tmp')
+            joblib.dump((tfidf_matrix, feature_names, nmf), tmp_file)
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            logger.warning(f"토픽 모델 캐시 저장 실패: {e}")
+        self._prune_topic_model_cache()
+        
+        return tfidf_matrix, feature_names, nmf
+    
+    @staticmethod
+    def _prune_topic_model_cache() -> None:
+        """최근 사용한 토픽 모델 캐시 파일만 남기고 오래된 파일(이전 버전 포함)을 삭제합니다."""
+        try:
+            cache_files = sorted(CACHE_DIR.glob('topic_*.joblib'),
+                                 key=lambda path: path.stat().st_mtime, reverse=True)
+            for stale_file in cache_files[TOPIC_MODEL_CACHE_MAX_FILES:]:
+                stale_file.unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning(f"토픽 모델 캐시 정리 실패: {e}")
+    
+    @staticmethod
+    def _build_topic_estimators(n_docs: int, stop_words: List[str], n_topics: int) -> Tuple[Any, Any, Any]:
+        """문서 수에 맞는 벡터화기, TF-IDF 변환기(어휘 사전 방식은 벡터화기가 가중치까지 계산하므로 None), NMF를 생성합니다."""
+        # 대용량 코퍼스는 어휘 사전 없이 해싱한 뒤 TF-IDF 가중치 적용
+        if n_docs >= TOPIC_HASHING_MIN_DOCS:
+            vectorizer = HashingVectorizer(
+                n_features=TOPIC_HASHING_FEATURES,
+                stop_words=stop_words,
+                ngram_range=(1, 2),
+                alternate_sign=False,
+                norm=None
+            )
+            transformer = TfidfTransformer()
+        else:
+            vectorizer = TfidfVectorizer(
+                max_features=1000,
+                stop_words=stop_words,
+                min_df=2,
+                max_df=0.95,
+                ngram_range=(1, 2)
+            )
+            transformer = None
+        
+        if n_docs >= TOPIC_MINIBATCH_MIN_DOCS:
+            nmf = MiniBatchNMF(n_components=n_topics, random_state=42, batch_size=1024,
+                               max_iter=100, init='nndsvd')
+        else:
+            nmf = NMF(n_components=n_topics, random_state=42, max_iter=200)
+        return vectorizer, transformer, nmf
+    
+    def _fit_topic_model(self, texts: np.ndarray, vectorizer, transformer,
+                         nmf) -> Tuple[Any, np.ndarray, Any]:
+        """TF-IDF 벡터화와 NMF 학습을 수행합니다."""
+        # TF-IDF 벡터화
+        use_hashing = isinstance(vectorizer, HashingVectorizer)
+        if use_hashing:
+            hashing_vectorizer = vectorizer
+            tfidf_matrix = transformer.fit_transform(hashing_vectorizer.transform(texts))
+        else:
+            tfidf_matrix = vectorizer.fit_transform(texts)
+            feature_names = vectorizer.get_feature_names_out()
         
-        for year in sorted(self.df['연도'].unique()):
-            year_mask = self.df['연도'] == year
-            year_topics = doc_topics[year_mask]
-            
-            if len(year_topics) > 0:
-                avg_topics = year_topics.mean(axis=0)
-                yearly_dist.append([year] + avg_topics.tolist())
+        # NMF 토픽 모델링
+        nmf.fit(tfidf_matrix)
+        
+        if use_hashing:
+            # 토픽 상위 단어로 쓰일 해시 컬럼만 원래 단어로 복원
+            feature_names = self._resolve_hashed_terms(texts, hashing_vectorizer, nmf.components_)
         
-        columns = ['연도'] + [f'토픽_{i+1}' for i in range(doc_topics.shape[1])]
-        return pd.DataFrame(yearly_dist, columns=columns)
+        return tfidf_matrix, feature_names, nmf
+    
+    def _resolve_hashed_terms(self, texts: np.ndarray, hashing_vectorizer: HashingVectorizer,
+                              components: np.ndarray, top_n: int = 10) -> np.ndarray:
+        """토픽 상위 해시 컬럼에 가장 많이 매핑된 단어를 문서 표본에서 찾아 특성 이름 배열로 반환합니다."""
+        n_features = hashing_vectorizer.n_features
+        # 상위 단어 빈도 추정에는 표본으로 충분하므로 전체 코퍼스를 다시 토큰화하지 않음
+        if len(texts) > TOPIC_TERM_SAMPLE_DOCS:
+            sample_idx = np.random.RandomState(42).choice(len(texts), size=TOPIC_TERM_SAMPLE_DOCS, replace=False)
+            texts = texts[np.sort(sample_idx)]
+        needed = set(np.argsort(components, axis=1)[:, -top_n:].ravel().tolist())
+        analyzer = hashing_vectorizer.build_analyzer()
+        term_columns: Dict[str, int] = {}
+        term_counts = {column: Counter() for column in needed}
+        
+        for text in texts:
+            for term in analyzer(text):
+                column = term_columns.get(term)
+                if column is None:
+                    # HashingVectorizer와 같은 해시 (부호 있는 murmurhash3의 절댓값)
+                    column = term_columns[term] = abs(murmurhash3_32(term, seed=0)) % n_features
+                if column in term_counts:
+                    term_counts[column][term] += 1
+        
+        feature_names = np.full(n_features, '', dtype=object)
+        for column, counts in term_counts.items():
+            if counts:
+                feature_names[column] = counts.most_common(1)[0][0]
+        return feature_names
+    
+    def _calculate_yearly_topic_distribution(self, doc_topics: np.ndarray) -> pd.DataFrame:
+        """연도별 토픽 분포를 계산합니다."""
+        columns = [f'토픽_{i+1}' for i in range(doc_topics.shape[1])]
+        topic_df = pd.DataFrame(doc_topics, columns=columns)
+        topic_df.insert(0, '연도', self.df['연도'].to_numpy())
+        return topic_df.groupby('연도', sort=True).mean().reset_index()
     
+    @_cached_by_data
     def detect_change_points(self) -> Dict[str, Any]:
         """연도별 평균 평점의 변화점을 탐지합니다."""
         logger.info("변화점 탐지 시작")
@@ -276,10 +537,14 @@ class AdvancedAnalyzer:
         signal = yearly_ratings['평점'].values
         years = yearly_ratings['연도'].values
         
-        # Pelt 알고리즘 사용
-        penalty = self.advanced_options.get('change_point_penalty', 10)
-        algo = ruptures.Pelt(model="rbf").fit(signal)
-        change_points = algo.predict(pen=penalty)
+        # Pelt 알고리즘 사용 (연도별 평균은 짧은 1차원 신호라 커널 없이 평균 변화(l2)로 탐지)
+        if len(signal) < 4:
+            # 구간을 나눌 만큼 연도가 많지 않으면 변화점 없음
+            change_points = [len(signal)]
+        else:
+            penalty = self.advanced_options.get('change_point_penalty', 10)
+            algo = ruptures.Pelt(model="l2", jump=1, min_size=1).fit(signal)
+            change_points = algo.predict(pen=penalty)
         
         # 변화점 정보 추출
         change_point_info = []
@@ -4,23 +4,85 @@
 import pandas as pd
 import numpy as np
 import re
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Sequence, Tuple, Any
 import logging
 from collections import Counter
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 from .config import (
     ANALYSIS_OPTIONS, ASPECT_KEYWORDS, NEGATIVE_KEYWORDS, 
     SEGMENT_RULES
 )
-from .advanced_analysis import AdvancedAnalyzer
+from ._jit_kernels import NUMBA_AVAILABLE, masked_group_stats
 
 logger = logging.getLogger(__name__)
 
+# 감정 라벨 (감정 코드 0/1/2 순서)
+SENTIMENT_LABELS = ('긍정', '중립', '부정')
+NUMBA_MIN_ROWS = 20_000  # 이 리뷰 수 이상이면 Numba 커널로 그룹별 통계를 한 번에 집계
+
+# 키워드 사전은 실행 중 바뀌지 않으므로 검색용 구조는 모듈 로드 시 한 번만 구성
+# 부정 키워드별 정규식 (중복 키워드 제거)
+NEGATIVE_KEYWORD_PATTERNS = tuple(
+    (keyword, re.compile(re.escape(keyword))) for keyword in dict.fromkeys(NEGATIVE_KEYWORDS)
+)
+# 그룹별 키워드 alternation 정규식 (첫 매칭에서 검색 중단)
+ASPECT_PATTERNS = {
+    name: re.compile('|'.join(re.escape(keyword) for keyword in keywords))
+    for name, keywords in ASPECT_KEYWORDS.items()
+}
+SEGMENT_PATTERNS = {
+    name: re.compile('|'.join(re.escape(keyword) for keyword in keywords))
+    for name, keywords in SEGMENT_RULES.items()
+}
+# 전체 키워드 번호와 그룹별 키워드 소속 여부 (오토마톤 매칭 결과 해석용)
+KEYWORDS = tuple(dict.fromkeys(
+    [keyword for group in ASPECT_KEYWORDS.values() for keyword in group] +
+    [keyword for group in SEGMENT_RULES.values() for keyword in group] +
+    list(NEGATIVE_KEYWORDS)
+))
+KEYWORD_IDS = {keyword: idx for idx, keyword in enumerate(KEYWORDS)}
+
+
+def _keyword_membership(groups: Dict[str, Sequence[str]]) -> Dict[str, np.ndarray]:
+    """그룹별로 전체 키워드 번호 중 소속 키워드 여부 (bool 배열)"""
+    membership = {}
+    for name, keywords in groups.items():
+        in_group = np.zeros(len(KEYWORDS), dtype=bool)
+        in_group[[KEYWORD_IDS[keyword] for keyword in keywords]] = True
+        membership[name] = in_group
+    return membership
+
+
+ASPECT_MEMBERSHIP = _keyword_membership(ASPECT_KEYWORDS)
+SEGMENT_MEMBERSHIP = _keyword_membership(SEGMENT_RULES)
+NEGATIVE_KEYWORD_IDS = np.array([KEYWORD_IDS[keyword] for keyword in NEGATIVE_KEYWORDS], dtype=np.int64)
+
+if AHOCORASICK_AVAILABLE:
+    KEYWORD_AUTOMATON = ahocorasick.Automaton()
+    for _idx, _keyword in enumerate(KEYWORDS):
+        KEYWORD_AUTOMATON.add_word(_keyword, _idx)
+    KEYWORD_AUTOMATON.make_automaton()
+
+
+def _popcount(packed: np.ndarray) -> np.ndarray:
+    """packbits 비트맵의 마지막 축 기준 1 비트 수"""
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(packed).sum(axis=-1, dtype=np.int64)
+    return np.unpackbits(packed, axis=-1).sum(axis=-1, dtype=np.int64)
+
+
 class ReviewAnalyzer:
     """리뷰 분석 클래스 (성능 최적화 버전)"""
     
     def __init__(self, df: pd.DataFrame, options: Dict[str, Any] = None):
-        self.df = df.copy()
+        # 얕은 복사: 기존 컬럼 데이터는 공유하고 컬럼 추가/교체만 이 DataFrame에 반영
+        self.df = df.copy(deep=False)
         self.options = options or ANALYSIS_OPTIONS
         self.sentiment_thresholds = self.options['sentiment_thresholds']
         
@@ -31,14 +93,30 @@ class ReviewAnalyzer:
         """분석을 위한 데이터 전처리를 한 번만 수행"""
         logger.info("분석용 데이터 전처리 시작")
         
-        # 1. 감정 라벨링 (한 번만 수행)
-        self.df['감정'] = self.df['평점'].apply(self._label_sentiment)
-        
-        # 2. 통합 텍스트 생성 (한 번만 수행)
-        self.df['통합_텍스트'] = (
-            self.df['제목'].astype(str) + ' ' + 
-            self.df['내용'].astype(str) + ' ' + 
-            self.df['평가'].astype(str)
+        # 전처리 결과가 바뀌므로 Aspect 분석 캐시 무효화
+        self._aspect_cache = None
+        
+        # 평점이 결측 없이 int8 범위의 정수이면 int8로 축소 (메모리/대역폭 절감)
+        ratings = self.df['평점']
+        if (pd.api.types.is_numeric_dtype(ratings) and ratings.notna().all()
+                and ratings.between(0, np.iinfo(np.int8).max).all() and (ratings % 1 == 0).all()):
+            self.df['평점'] = ratings.astype(np.int8)
+        
+        # 1. 감정 라벨링 (한 번만 수행, 평점 배열 비교로 벡터화)
+        # 평점/감정 코드 배열은 Aspect/세그먼트 집계에서 마스크와 함께 재사용
+        self._ratings = self.df['평점'].to_numpy(dtype=float, na_value=np.nan)
+        self._sentiment_codes = np.select(
+            [self._ratings >= self.sentiment_thresholds['positive'],
+             self._ratings <= self.sentiment_thresholds['negative']],
+            [0, 2],
+            default=1
+        ).astype(np.int8)
+        self.df['감정'] = pd.Categorical.from_codes(self._sentiment_codes, categories=SENTIMENT_LABELS)
+        
+        # 2. 통합 텍스트 생성 (한 번만 수행, 세 컬럼을 한 번에 결합)
+        self.df['통합_텍스트'] = self.df['제목'].astype(str).str.cat(
+            [self.df['내용'].astype(str), self.df['평가'].astype(str)],
+            sep=' ', na_rep=''
         )
         
         # 3. 키워드 매칭 결과를 미리 계산 (벡터화된 방식)
@@ -48,33 +126,77 @@ class ReviewAnalyzer:
     
     def _precompute_keyword_matches(self):
         """모든 키워드 매칭을 미리 계산하여 성능 향상"""
-        # Aspect 키워드 매칭
-        self.aspect_matches = {}
-        for aspect_name, keywords in ASPECT_KEYWORDS.items():
-            # 벡터화된 매칭: 각 키워드가 텍스트에 포함되는지 확인
-            matches = self.df['통합_텍스트'].apply(
-                lambda text: any(keyword in text for keyword in keywords)
-            )
-            self.aspect_matches[aspect_name] = matches
+        texts = self.df['통합_텍스트'].to_numpy(dtype=object)
+        negative_rows = (self.df['평점'] <= self.sentiment_thresholds['negative']).to_numpy()
+        
+        if AHOCORASICK_AVAILABLE:
+            aspect_masks, segment_masks = self._scan_keywords_with_automaton(texts, negative_rows)
+        else:
+            aspect_masks, segment_masks = self._scan_keywords_with_regex(texts, negative_rows)
+        
+        # 매칭 마스크와 감정별 마스크를 (그룹 x 리뷰) 비트맵으로 압축해 보관
+        self.aspect_names = list(ASPECT_KEYWORDS)
+        self.aspect_bitmap = np.packbits(np.vstack([aspect_masks[name] for name in self.aspect_names]), axis=1)
+        self.segment_names = list(SEGMENT_RULES)
+        self.segment_bitmap = np.packbits(np.vstack([segment_masks[name] for name in self.segment_names]), axis=1)
+        self._sentiment_bitmap = np.packbits(
+            self._sentiment_codes == np.arange(len(SENTIMENT_LABELS), dtype=np.int8)[:, None], axis=1
+        )
+    
+    def _scan_keywords_with_regex(self, texts: np.ndarray, negative_rows: np.ndarray):
+        """그룹별 정규식으로 Aspect/세그먼트 매칭 마스크를 만들고 부정 키워드를 집계"""
+        # Aspect 키워드 매칭 (그룹 키워드를 하나의 정규식으로 결합해 첫 매칭에서 검색 중단)
+        aspect_masks = {}
+        for aspect_name, pattern in ASPECT_PATTERNS.items():
+            aspect_masks[aspect_name] = self._contains_any(texts, pattern)
         
         # 세그먼트 키워드 매칭
-        self.segment_matches = {}
-        for segment_name, keywords in SEGMENT_RULES.items():
-            matches = self.df['통합_텍스트'].apply(
-                lambda text: any(keyword in text for keyword in keywords)
-            )
-            self.segment_matches[segment_name] = matches
+        segment_masks = {}
+        for segment_name, pattern in SEGMENT_PATTERNS.items():
+            segment_masks[segment_name] = self._contains_any(texts, pattern)
         
         # 부정 키워드 매칭 (카운팅용)
         self.negative_keyword_counts = Counter()
-        negative_reviews = self.df[self.df['평점'] <= self.sentiment_thresholds['negative']]
-        
-        if len(negative_reviews) > 0:
-            all_negative_text = ' '.join(negative_reviews['통합_텍스트'])
-            for keyword in NEGATIVE_KEYWORDS:
-                count = len(re.findall(keyword, all_negative_text))
+        if negative_rows.any():
+            all_negative_text = ' '.join(texts[negative_rows])
+            for keyword, pattern in NEGATIVE_KEYWORD_PATTERNS:
+                count = len(pattern.findall(all_negative_text))
                 if count > 0:
                     self.negative_keyword_counts[keyword] = count
+        
+        return aspect_masks, segment_masks
+    
+    @staticmethod
+    def _contains_any(texts: np.ndarray, pattern: re.Pattern) -> np.ndarray:
+        """텍스트별로 그룹 정규식의 키워드 중 하나라도 포함하는지 여부 (bool 배열)"""
+        return np.fromiter((pattern.search(text) is not None for text in texts), dtype=bool, count=len(texts))
+    
+    def _scan_keywords_with_automaton(self, texts: np.ndarray, negative_rows: np.ndarray):
+        """Aspect/세그먼트/부정 키워드를 하나의 Aho-Corasick 오토마톤으로 리뷰당 한 번만 스캔"""
+        # 한 번의 스캔으로 (리뷰 번호, 키워드 번호) 매칭 목록을 CSR 형태(indptr/indices)로 수집
+        indptr = np.zeros(len(texts) + 1, dtype=np.int64)
+        hits = []
+        for row, text in enumerate(texts):
+            hits.extend(idx for _, idx in KEYWORD_AUTOMATON.iter(text))
+            indptr[row + 1] = len(hits)
+        match_keywords = np.array(hits, dtype=np.int32)
+        match_rows = np.repeat(np.arange(len(texts)), np.diff(indptr))
+        
+        def group_masks(membership: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+            masks = {}
+            for name, in_group in membership.items():
+                mask = np.zeros(len(texts), dtype=bool)
+                mask[match_rows[in_group[match_keywords]]] = True
+                masks[name] = mask
+            return masks
+        
+        # 부정 리뷰의 부정 키워드는 출현 횟수 집계 (동점 키워드 순서가 유지되도록 사전 순서대로 저장)
+        negative_hits = np.bincount(match_keywords[negative_rows[match_rows]], minlength=len(KEYWORDS))
+        self.negative_keyword_counts = Counter({
+            keyword: int(count)
+            for keyword, count in zip(NEGATIVE_KEYWORDS, negative_hits[NEGATIVE_KEYWORD_IDS].tolist()) if count
+        })
+        return group_masks(ASPECT_MEMBERSHIP), group_masks(SEGMENT_MEMBERSHIP)
     
     def calculate_kpis(self) -> Dict[str, Any]:
         """핵심 성과지표(KPI)를 계산합니다."""
@@ -83,8 +205,8 @@ class ReviewAnalyzer:
         kpis = {
             "총_리뷰_수": len(self.df),
             "평균_평점": round(self.df['평점'].mean(), 2),
-            "최저_평점": self.df['평점'].min(),
-            "최고_평점": self.df['평점'].max(),
+            "최저_평점": float(self.df['평점'].min()),
+            "최고_평점": float(self.df['평점'].max()),
             "최신_리뷰일": self.df['작성일자'].max().strftime('%Y-%m-%d'),
             "데이터_기간": {
                 "시작일": self.df['작성일자'].min().strftime('%Y-%m-%d'),
@@ -122,26 +244,34 @@ class ReviewAnalyzer:
         """연도별, 분기별 트렌드를 분석합니다."""
         logger.info("트렌드 분석 시작")
         
-        # 연도별 분석
-        yearly_stats = self.df.groupby('연도').agg({
-            '평점': ['count', 'mean'],
-            '작성일자': 'max'
-        }).round(2)
-        yearly_stats.columns = ['리뷰_수', '평균_평점', '최신_리뷰일']
+        # 월별로 한 번만 그룹화한 뒤 분기/연도는 월별 집계를 합산해 계산
+        monthly = self.df.groupby(['연도', '월']).agg(
+            리뷰_수=('평점', 'count'),
+            평점_합계=('평점', 'sum'),
+            최신_리뷰일=('작성일자', 'max')
+        ).reset_index()
+        monthly['평균_평점'] = monthly['평점_합계'] / monthly['리뷰_수']
+        monthly['분기'] = (monthly['월'] - 1) // 3 + 1
+        
+        # 월별 분석
+        monthly_stats = monthly[['연도', '월', '리뷰_수', '평균_평점']].round(2)
         
         # 분기별 분석
-        quarterly_stats = self.df.groupby(['연도', '분기']).agg({
-            '평점': ['count', 'mean']
-        }).round(2)
-        quarterly_stats.columns = ['리뷰_수', '평균_평점']
-        quarterly_stats = quarterly_stats.reset_index()
+        quarterly_stats = monthly.groupby(['연도', '분기']).agg(
+            리뷰_수=('리뷰_수', 'sum'),
+            평점_합계=('평점_합계', 'sum')
+        )
+        quarterly_stats['평균_평점'] = quarterly_stats['평점_합계'] / quarterly_stats['리뷰_수']
+        quarterly_stats = quarterly_stats[['리뷰_수', '평균_평점']].round(2).reset_index()
         
-        # 월별 분석
-        monthly_stats = self.df.groupby(['연도', '월']).agg({
-            '평점': ['count', 'mean']
-        }).round(2)
-        monthly_stats.columns = ['리뷰_수', '평균_평점']
-        monthly_stats = monthly_stats.reset_index()
+        # 연도별 분석
+        yearly_stats = monthly.groupby('연도').agg(
+            리뷰_수=('리뷰_수', 'sum'),
+            평점_합계=('평점_합계', 'sum'),
+            최신_리뷰일=('최신_리뷰일', 'max')
+        )
+        yearly_stats['평균_평점'] = yearly_stats['평점_합계'] / yearly_stats['리뷰_수']
+        yearly_stats = yearly_stats[['리뷰_수', '평균_평점', '최신_리뷰일']].round(2)
         
         logger.info("트렌드 분석 완료")
         return {
@@ -155,11 +285,26 @@ class ReviewAnalyzer:
         logger.info("감정 분석 시작")
         
         # 감정별 통계 (이미 계산된 감정 컬럼 사용)
-        sentiment_stats = self.df['감정'].value_counts().to_dict()
-        sentiment_ratio = (self.df['감정'].value_counts(normalize=True) * 100).round(1).to_dict()
-        
-        # 감정 변화 추이 (연도별)
-        sentiment_trend = self.df.groupby(['연도', '감정']).size().unstack(fill_value=0)
+        # 범주형 value_counts는 없는 감정도 0으로 포함하므로 등장한 감정만 남김
+        sentiment_counts = self.df['감정'].value_counts()
+        sentiment_counts = sentiment_counts[sentiment_counts > 0]
+        sentiment_stats = sentiment_counts.to_dict()
+        sentiment_ratio = (sentiment_counts / sentiment_counts.sum() * 100).round(1).to_dict()
+        
+        # 감정 변화 추이 (연도 x 감정 코드 2차원 빈도, 결합 키 bincount로 집계)
+        year_codes, years = pd.factorize(self.df['연도'], sort=True)
+        valid = year_codes >= 0
+        n_labels = len(SENTIMENT_LABELS)
+        counts = np.bincount(
+            year_codes[valid] * n_labels + self._sentiment_codes[valid],
+            minlength=len(years) * n_labels
+        ).reshape(len(years), n_labels)
+        observed = counts.sum(axis=0) > 0
+        sentiment_trend = pd.DataFrame(
+            counts[:, observed],
+            index=pd.Index(years, name='연도'),
+            columns=pd.Index(np.array(SENTIMENT_LABELS, dtype=object)[observed], dtype=str, name='감정')
+        )
         
         logger.info("감정 분석 완료")
         return {
@@ -168,41 +313,64 @@ class ReviewAnalyzer:
             "감정_변화_추이": sentiment_trend
         }
     
-    def _label_sentiment(self, rating: float) -> str:
-        """평점을 기반으로 감정을 라벨링합니다."""
-        if rating >= self.sentiment_thresholds['positive']:
-            return '긍정'
-        elif rating <= self.sentiment_thresholds['negative']:
-            return '부정'
-        else:
-            return '중립'
-    
     def analyze_aspects(self) -> Dict[str, Any]:
         """Aspect 분석을 수행합니다."""
+        # 우선순위 계산에서도 호출되므로 한 번 계산한 결과 재사용
+        if self._aspect_cache is not None:
+            return self._aspect_cache
+        
         logger.info("Aspect 분석 시작")
         
         aspect_results = {}
         
-        # 미리 계산된 매칭 결과 사용
+        # 미리 계산된 매칭 결과 사용 (전체 Aspect 통계를 한 번에 집계)
+        aspect_stats = self._group_stats(self.aspect_bitmap, self.aspect_names)
         for aspect_name in ASPECT_KEYWORDS.keys():
-            aspect_results[aspect_name] = self._analyze_single_aspect_optimized(aspect_name)
+            aspect_results[aspect_name] = self._analyze_single_aspect_optimized(
+                aspect_name, aspect_stats[aspect_name]
+            )
         
         # 전체 Aspect 요약
         aspect_summary = self._summarize_aspects(aspect_results)
         
         logger.info("Aspect 분석 완료")
-        return {
+        self._aspect_cache = {
             "aspect_상세": aspect_results,
             "aspect_요약": aspect_summary
         }
+        return self._aspect_cache
+    
+    def _group_stats(self, bitmap: np.ndarray, names: List[str]) -> Dict[str, Tuple[int, np.ndarray, float]]:
+        """그룹별 (매칭 수, 감정별 수, 평균 평점)을 비트맵에서 한 번에 집계"""
+        n_rows = len(self._ratings)
+        if names and NUMBA_AVAILABLE and n_rows >= NUMBA_MIN_ROWS:
+            masks = np.unpackbits(bitmap, axis=1, count=n_rows).view(bool)
+            totals, sentiment_counts, mean_ratings = masked_group_stats(
+                masks, self._sentiment_codes, self._ratings, len(SENTIMENT_LABELS)
+            )
+        else:
+            # 매칭 비트맵과 감정 비트맵의 AND 결과 비트 수로 감정별 리뷰 수 계산
+            sentiment_counts = _popcount(bitmap[:, None, :] & self._sentiment_bitmap[None, :, :])
+            totals = _popcount(bitmap)
+            # 평균 평점은 NaN을 제외한 평점 합계/개수
+            masks = np.unpackbits(bitmap, axis=1, count=n_rows)
+            valid = ~np.isnan(self._ratings)
+            rating_sums = masks @ np.where(valid, self._ratings, 0.0)
+            rating_counts = masks @ valid.astype(np.int64)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                mean_ratings = rating_sums / rating_counts
+        return {
+            name: (int(totals[idx]), sentiment_counts[idx], mean_ratings[idx])
+            for idx, name in enumerate(names)
+        }
     
-    def _analyze_single_aspect_optimized(self, aspect_name: str) -> Dict[str, Any]:
+    def _analyze_single_aspect_optimized(self, aspect_name: str,
+                                         stats: Tuple[int, np.ndarray, float]) -> Dict[str, Any]:
         """단일 Aspect를 분석합니다 (최적화 버전)."""
-        # 미리 계산된 매칭 결과 사용
-        matched_mask = self.aspect_matches[aspect_name]
-        matched_reviews = self.df[matched_mask]
+        # 비트맵에서 집계된 통계 사용 (DataFrame 슬라이싱 없음)
+        total_count, sentiment_counts, mean_rating = stats
         
-        if len(matched_reviews) == 0:
+        if total_count == 0:
             return {
                 "매칭_리뷰_수": 0,
                 "긍정_수": 0,
@@ -214,13 +382,7 @@ class ReviewAnalyzer:
                 "평균_평점": 0
             }
         
-        # 감정별 분류 (이미 계산된 감정 컬럼 사용)
-        sentiment_counts = matched_reviews['감정'].value_counts()
-        
-        positive_count = sentiment_counts.get('긍정', 0)
-        negative_count = sentiment_counts.get('부정', 0)
-        neutral_count = sentiment_counts.get('중립', 0)
-        total_count = len(matched_reviews)
+        positive_count, neutral_count, negative_count = sentiment_counts.tolist()
         
         return {
             "매칭_리뷰_수": total_count,
@@ -230,23 +392,31 @@ class ReviewAnalyzer:
             "긍정_비율": round(positive_count / total_count * 100, 1) if total_count > 0 else 0,
             "부정_비율": round(negative_count / total_count * 100, 1) if total_count > 0 else 0,
             "중립_비율": round(neutral_count / total_count * 100, 1) if total_count > 0 else 0,
-            "평균_평점": round(matched_reviews['평점'].mean(), 2)
+            "평균_평점": round(mean_rating, 2)
         }
     
     def _summarize_aspects(self, aspect_results: Dict[str, Any]) -> pd.DataFrame:
         """Aspect 분석 결과를 요약합니다."""
-        summary_data = []
-        for aspect_name, result in aspect_results.items():
-            summary_data.append({
-                'Aspect': aspect_name,
-                '매칭_리뷰_수': result['매칭_리뷰_수'],
-                '긍정_비율': result['긍정_비율'],
-                '부정_비율': result['부정_비율'],
-                '중립_비율': result['중립_비율'],
-                '평균_평점': result['평균_평점']
-            })
-        
-        return pd.DataFrame(summary_data)
+        # 행(dict) 단위 누적 대신 컬럼별 배열을 미리 할당해 채움
+        n = len(aspect_results)
+        names = np.empty(n, dtype=object)
+        matched = np.empty(n, dtype=np.int64)
+        ratios = np.empty((3, n), dtype=np.float64)
+        mean_ratings = np.empty(n, dtype=np.float64)
+        for i, (aspect_name, result) in enumerate(aspect_results.items()):
+            names[i] = aspect_name
+            matched[i] = result['매칭_리뷰_수']
+            ratios[:, i] = (result['긍정_비율'], result['부정_비율'], result['중립_비율'])
+            mean_ratings[i] = result['평균_평점']
+        
+        return pd.DataFrame({
+            'Aspect': names,
+            '매칭_리뷰_수': matched,
+            '긍정_비율': ratios[0],
+            '부정_비율': ratios[1],
+            '중립_비율': ratios[2],
+            '평균_평점': mean_ratings
+        })
     
     def extract_negative_keywords(self, top_n: int = None) -> List[Tuple[str, int]]:
         """부정 키워드를 추출합니다."""
@@ -267,20 +437,23 @@ class ReviewAnalyzer:
         
         segment_results = {}
         
-        # 미리 계산된 매칭 결과 사용
+        # 미리 계산된 매칭 결과 사용 (전체 세그먼트 통계를 한 번에 집계)
+        segment_stats = self._group_stats(self.segment_bitmap, self.segment_names)
         for segment_name in SEGMENT_RULES.keys():
-            segment_results[segment_name] = self._analyze_single_segment_optimized(segment_name)
+            segment_results[segment_name] = self._analyze_single_segment_optimized(
+                segment_name, segment_stats[segment_name]
+            )
         
         logger.info("세그먼트 분석 완료")
         return segment_results
     
-    def _analyze_single_segment_optimized(self, segment_name: str) -> Dict[str, Any]:
+    def _analyze_single_segment_optimized(self, segment_name: str,
+                                          stats: Tuple[int, np.ndarray, float]) -> Dict[str, Any]:
         """단일 세그먼트를 분석합니다 (최적화 버전)."""
-        # 미리 계산된 매칭 결과 사용
-        matched_mask = self.segment_matches[segment_name]
-        matched_reviews = self.df[matched_mask]
+        # 비트맵에서 집계된 통계 사용 (DataFrame 슬라이싱 없음)
+        total_count, sentiment_counts, mean_rating = stats
         
-        if len(matched_reviews) == 0:
+        if total_count == 0:
             return {
                 "매칭_리뷰_수": 0,
                 "평균_평점": 0,
@@ -288,16 +461,11 @@ class ReviewAnalyzer:
                 "부정_비율": 0
             }
         
-        # 통계 계산 (이미 계산된 감정 컬럼 사용)
-        sentiment_counts = matched_reviews['감정'].value_counts()
-        
-        positive_count = sentiment_counts.get('긍정', 0)
-        negative_count = sentiment_counts.get('부정', 0)
-        total_count = len(matched_reviews)
+        positive_count, _, negative_count = sentiment_counts.tolist()
         
         return {
             "매칭_리뷰_수": total_count,
-            "평균_평점": round(matched_reviews['평점'].mean(), 2),
+            "평균_평점": round(mean_rating, 2),
             "긍정_비율": round(positive_count / total_count * 100, 1),
             "부정_비율": round(negative_count / total_count * 100, 1)
         }
@@ -310,31 +478,28 @@ class ReviewAnalyzer:
         aspect_analysis = self.analyze_aspects()
         aspect_summary = aspect_analysis['aspect_요약']
         
-        # 우선순위 점수 계산
-        priority_scores = []
-        for _, row in aspect_summary.iterrows():
-            if row['매칭_리뷰_수'] > 0:  # 매칭된 리뷰가 있는 경우만
-                # 부정 비율과 언급 빈도를 가중 평균
-                negative_ratio_score = row['부정_비율'] / 100
-                mention_frequency_score = row['매칭_리뷰_수'] / len(self.df)
-                
-                weights = self.options['priority_score_weight']
-                priority_score = (
-                    negative_ratio_score * weights['negative_ratio'] +
-                    mention_frequency_score * weights['mention_frequency']
-                )
-                
-                priority_scores.append({
-                    'Aspect': row['Aspect'],
-                    '부정_비율': row['부정_비율'],
-                    '언급_빈도': round(mention_frequency_score * 100, 1),
-                    '우선순위_점수': round(priority_score * 100, 2),
-                    '매칭_리뷰_수': row['매칭_리뷰_수']
-                })
+        # 우선순위 점수 계산 (매칭된 리뷰가 있는 Aspect만, 컬럼 단위 벡터 연산)
+        matched_summary = aspect_summary[aspect_summary['매칭_리뷰_수'] > 0]
+        matched = matched_summary['매칭_리뷰_수'].to_numpy()
+        negative_ratio = matched_summary['부정_비율'].to_numpy()
+        
+        # 부정 비율과 언급 빈도를 가중 평균
+        weights = self.options['priority_score_weight']
+        mention_frequency_score = matched / len(self.df)
+        priority_score = (
+            negative_ratio / 100 * weights['negative_ratio'] +
+            mention_frequency_score * weights['mention_frequency']
+        )
         
         # 점수 기준으로 정렬
-        priority_df = pd.DataFrame(priority_scores)
-        priority_df = priority_df.sort_values('우선순위_점수', ascending=False)
+        priority_df = pd.DataFrame({
+            'Aspect': matched_summary['Aspect'].to_numpy(),
+            '부정_비율': negative_ratio,
+            '언급_빈도': np.round(mention_frequency_score * 100, 1),
+            '우선순위_점수': np.round(priority_score * 100, 2),
+            '매칭_리뷰_수': matched
+        })
+        priority_df = priority_df.sort_values('우선순위_점수', ascending=False, kind='stable')
         
         logger.info("우선순위 점수 계산 완료")
         return priority_df
@@ -374,6 +539,8 @@ class ReviewAnalyzer:
         if self.options.get('enable_advanced_analysis', False):
             logger.info("고급 분석 시작")
             try:
+                # scikit-learn 등 무거운 의존성은 고급 분석을 켠 경우에만 로드
+                from .advanced_analysis import AdvancedAnalyzer
                 advanced_analyzer = AdvancedAnalyzer(self.df)
                 advanced_results = advanced_analyzer.run_advanced_analysis()
                 summary["고급분석"] = advanced_results
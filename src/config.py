@@ -21,10 +21,14 @@ FONT_PATH = PROJECT_ROOT / "assets" / "NanumBarunGothic.ttf"
 OUTPUT_DIR = PROJECT_ROOT / "outputs"
 FIGURES_DIR = OUTPUT_DIR / "figures"
 REPORT_DIR = OUTPUT_DIR / "report"
+CACHE_DIR = OUTPUT_DIR / "cache"  # 학습된 모델 등 재사용 가능한 중간 결과
 
 # 템플릿 경로
 TEMPLATE_DIR = PROJECT_ROOT / "templates"
 
+# 유효 평점 범위 (CLI 전처리와 웹 분석 공용)
+RATING_RANGE = (1, 10)
+
 # 분석 옵션 설정
 ANALYSIS_OPTIONS = {
     "enable_advanced_analysis": False,  # 배포 안정성을 위해 기본 비활성화
@@ -43,6 +47,8 @@ ANALYSIS_OPTIONS = {
         "enable_rating_prediction": False,  # 평점 예측 모델
         "enable_topic_modeling": False,     # 토픽 모델링
         "enable_change_point_detection": False,  # 변화점 탐지
+        "enable_shap": True,               # SHAP 분석 (평점 예측 사용 시)
+        "shap_sample_size": 200,           # SHAP 계산에 사용할 최대 샘플 수
         "shap_top_features": 10,           # SHAP 상위 특성 수
         "topic_count": 8,                  # 토픽 개수
         "min_topic_size": 5,               # 최소 토픽 크기
@@ -50,49 +56,50 @@ ANALYSIS_OPTIONS = {
     }
 }
 
-# Aspect 분석 키워드 사전
+# Aspect 분석 키워드 사전 (순회 전용이므로 튜플로 고정)
 ASPECT_KEYWORDS = {
-    "청결": [
+    "청결": (
         "청결", "깨끗", "더럽", "지저분", "먼지", "바닥", "청소", "깔끔", "위생"
-    ],
-    "시설/온수": [
+    ),
+    "시설/온수": (
         "시설", "온수", "샤워", "온도", "따뜻", "차갑", "잠금장치", "리모델링", 
         "노후", "낡", "시설", "객실", "침대", "TV", "난방", "에어컨"
-    ],
-    "직원응대": [
+    ),
+    "직원응대": (
         "직원", "응대", "서비스", "친절", "불친절", "태도", "안내", "프론트", 
         "매니저", "부장", "고문", "격양", "말문막힘"
-    ],
-    "가격": [
+    ),
+    "가격": (
         "가격", "비싸", "저렴", "가성비", "요금", "비용", "패키지", "강정", 
         "조식", "식사", "음식", "맛있", "맛없"
-    ],
-    "온천수": [
+    ),
+    "온천수": (
         "온천", "탄산", "온천수", "탕", "사우나", "찜질방", "목욕", "온천욕", 
         "온천물", "효능", "피로", "힐링", "선녀탕", "노천탕"
-    ]
+    )
 }
 
 # 부정 키워드 사전 (간단 정규식 기반)
-NEGATIVE_KEYWORDS = [
+NEGATIVE_KEYWORDS = (
     "아쉽", "실망", "별로", "안좋", "나쁘", "불편", "문제", "결함", "고장",
     "부족", "떨어지", "낮", "안되", "못하", "싫", "짜증", "화나", "불쾌",
     "실종", "허", "늘어지", "떨어지", "낡", "오래", "노후", "지저분", "더럽",
     "차갑", "춥", "시끄럽", "소음", "비싸", "바가지", "불친절", "무시",
     "격양", "말문막힘", "아쉬워", "후회", "다시안갈", "추천안함"
-]
+)
 
 # 세그먼트 분석 규칙
 SEGMENT_RULES = {
-    "가족": ["가족", "부모님", "아이", "애", "어린이", "자녀"],
-    "등산": ["등산", "트레킹", "산행", "설악산", "주전골", "선녀탕", "만경대"],
-    "장기고객": ["자주", "많이", "오래", "정기", "단골", "매년", "분기마다"]
+    "가족": ("가족", "부모님", "아이", "애", "어린이", "자녀"),
+    "등산": ("등산", "트레킹", "산행", "설악산", "주전골", "선녀탕", "만경대"),
+    "장기고객": ("자주", "많이", "오래", "정기", "단골", "매년", "분기마다")
 }
 
 # 그래프 설정
 PLOT_CONFIG = {
     "figure_size": (12, 8),
     "dpi": 300,
+    "png_compress_level": 3,  # PNG zlib 압축 수준 (0-9, 낮을수록 저장이 빠르고 파일이 큼)
     "style": "default",
     "colors": {
         "positive": "#2E8B57",  # Sea Green
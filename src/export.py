@@ -3,43 +3,45 @@
 PDF와 PPTX 형식으로 리포트를 생성합니다.
 """
 
+import importlib.util
 import logging
-import os
-import re
+import numbers
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional
-import pandas as pd
 
 from .config import OUTPUT_DIR, FONT_PATH, REPORT_METADATA
 
 logger = logging.getLogger(__name__)
 
-try:
-    import subprocess
-    import platform
-    WKHTMLTOPDF_AVAILABLE = True
-    # wkhtmltopdf가 시스템에 설치되어 있는지 확인
+
+@lru_cache(maxsize=1)
+def _wkhtmltopdf_available() -> bool:
+    """wkhtmltopdf가 시스템에 설치되어 있는지 확인 (첫 PDF 생성 시 한 번만 프로세스 실행)"""
     try:
         subprocess.run(['wkhtmltopdf', '--version'], 
                       capture_output=True, check=True)
+        return True
     except (subprocess.CalledProcessError, FileNotFoundError):
-        WKHTMLTOPDF_AVAILABLE = False
         logger.warning("wkhtmltopdf가 시스템에 설치되지 않았습니다.")
-except ImportError:
-    WKHTMLTOPDF_AVAILABLE = False
-    logger.warning("subprocess 모듈을 사용할 수 없습니다. PDF 생성을 건너뜁니다.")
+        return False
+
 
-try:
-    from pptx import Presentation
-    from pptx.util import Inches, Pt
-    from pptx.enum.text import PP_ALIGN
-    from pptx.dml.color import RGBColor
-    PYTHON_PPTX_AVAILABLE = True
-except ImportError:
-    PYTHON_PPTX_AVAILABLE = False
+# python-pptx는 설치 여부만 미리 확인하고 실제 import는 PPTX 생성 시에 수행
+PYTHON_PPTX_AVAILABLE = importlib.util.find_spec('pptx') is not None
+if not PYTHON_PPTX_AVAILABLE:
     logger.warning("python-pptx 라이브러리가 설치되지 않았습니다. PPTX 생성을 건너뜁니다.")
 
 
+def _format_kpi(value: Any, spec: str, unit: str) -> str:
+    """KPI 값을 서식에 맞춰 문자열로 변환 (값이 없거나 숫자가 아니면 'N/A')"""
+    if isinstance(value, numbers.Real):
+        return f"{value:{spec}}{unit}"
+    return 'N/A'
+
+
 class ExportGenerator:
     """PDF와 PPTX 리포트 생성 클래스"""
     
@@ -51,60 +53,6 @@ class ExportGenerator:
         self.html_file_path = Path(html_file_path)
         self.output_dir = Path(OUTPUT_DIR)
         
-    def _enhance_html_for_pdf(self, html_path: Path) -> Path:
-        """
-        PDF 생성을 위해 HTML 파일의 색상을 강화합니다.
-        
-        Args:
-            html_path: 원본 HTML 파일 경로
-            
-        Returns:
-            강화된 HTML 파일 경로
-        """
-        try:
-            # HTML 파일 읽기
-            with open(html_path, 'r', encoding='utf-8') as f:
-                html_content = f.read()
-            
-            # 색상 강화 패턴들
-            enhancements = [
-                # KPI 카드 색상 강화
-                (r'<div class="kpi-card">', '<div class="kpi-card" style="background: #4682B4 !important; color: white !important; border: 2px solid #4682B4; padding: 15px !important; margin-bottom: 10px !important;">'),
-                # 테이블 헤더 색상 강화
-                (r'<th>', '<th style="background-color: #4682B4 !important; color: white !important; border: 1px solid #4682B4; font-size: 11px !important; padding: 8px !important;">'),
-                # 우선순위 색상 강화
-                (r'class="priority-high"', 'class="priority-high" style="color: #DC143C !important; font-weight: bold !important;"'),
-                (r'class="priority-medium"', 'class="priority-medium" style="color: #FF8C00 !important; font-weight: bold !important;"'),
-                (r'class="priority-low"', 'class="priority-low" style="color: #32CD32 !important; font-weight: bold !important;"'),
-                # 섹션 헤더 색상 강화
-                (r'<h2>', '<h2 style="color: #4682B4 !important; border-bottom: 2px solid #4682B4 !important; font-size: 1.3em !important; margin-bottom: 10px !important;">'),
-                # 컨테이너 배경 강화
-                (r'<div class="container">', '<div class="container" style="background-color: white !important; padding: 15px !important;">'),
-                # 차트 컨테이너 크기 조정
-                (r'<div class="chart-container">', '<div class="chart-container" style="margin: 15px 0 !important; page-break-inside: avoid !important;">'),
-                # 차트 이미지 크기 조정
-                (r'<img src="{{ plot_files.', '<img style="max-width: 90% !important; height: auto !important; max-height: 400px !important;" src="{{ plot_files.'),
-                # 테이블 셀 크기 조정
-                (r'<td>', '<td style="padding: 8px !important; font-size: 11px !important;">'),
-                # 섹션 크기 조정
-                (r'<div class="section">', '<div class="section" style="margin-bottom: 20px !important; padding: 15px !important; page-break-inside: avoid !important;">'),
-            ]
-            
-            # 색상 강화 적용
-            for pattern, replacement in enhancements:
-                html_content = re.sub(pattern, replacement, html_content)
-            
-            # 강화된 HTML 파일 저장
-            enhanced_html_path = html_path.parent / f"enhanced_{html_path.name}"
-            with open(enhanced_html_path, 'w', encoding='utf-8') as f:
-                f.write(html_content)
-            
-            return enhanced_html_path
-            
-        except Exception as e:
-            logger.warning(f"HTML 색상 강화 실패: {e}")
-            return html_path
-        
     def generate_pdf(self, output_filename: Optional[str] = None) -> Optional[str]:
         """
         HTML 리포트를 PDF로 변환 (wkhtmltopdf 사용)
@@ -115,7 +63,7 @@ class ExportGenerator:
         Returns:
             생성된 PDF 파일 경로 또는 None (실패 시)
         """
-        if not WKHTMLTOPDF_AVAILABLE:
+        if not _wkhtmltopdf_available():
             logger.error("wkhtmltopdf가 설치되지 않았습니다.")
             logger.info("설치 방법:")
             logger.info("1. https://wkhtmltopdf.org/downloads.html 에서 다운로드")
@@ -136,10 +84,7 @@ class ExportGenerator:
             # PDF 디렉토리 생성
             pdf_path.parent.mkdir(parents=True, exist_ok=True)
             
-            # HTML 색상 강화
-            enhanced_html_path = self._enhance_html_for_pdf(self.html_file_path)
-            
-            # wkhtmltopdf 명령어 실행 (색상 렌더링 개선 + 크기 조정)
+            # wkhtmltopdf 명령어 실행 (색상/크기는 템플릿의 @media print 스타일로 적용)
             cmd = [
                 'wkhtmltopdf',
                 '--page-size', 'A4',
@@ -162,7 +107,7 @@ class ExportGenerator:
                 '--zoom', '0.9',
                 '--minimum-font-size', '8',
                 '--disable-javascript',
-                str(enhanced_html_path),
+                str(self.html_file_path),
                 str(pdf_path)
             ]
             
@@ -198,6 +143,9 @@ class ExportGenerator:
             return None
             
         try:
+            from pptx import Presentation
+            from pptx.util import Pt
+            
             if output_filename is None:
                 output_filename = "summary.pptx"
                 
@@ -219,76 +167,58 @@ class ExportGenerator:
             title.text_frame.paragraphs[0].font.size = Pt(28)
             title.text_frame.paragraphs[0].font.bold = True
             
-            # 콘텐츠 영역
-            content = slide.placeholders[1]
-            content_frame = content.text_frame
+            # 콘텐츠 문단을 (텍스트, 글자 크기, 굵게 여부) 목록으로 모은 뒤 텍스트 프레임에 한 번에 기록
+            paragraphs = []
             
             # KPI 카드 정보 추가
             kpis = analysis_results.get('핵심성과지표', {})
             if kpis:
-                content_frame.text = "📊 핵심 성과지표"
-                p = content_frame.paragraphs[0]
-                p.font.size = Pt(18)
-                p.font.bold = True
+                paragraphs.append(("📊 핵심 성과지표", 18, True))
                 
                 # KPI 데이터 추가
-                kpi_text = f"• 총 리뷰 수: {kpis.get('총리뷰수', 'N/A'):,}개\n"
-                kpi_text += f"• 평균 평점: {kpis.get('평균평점', 'N/A'):.1f}점\n"
-                kpi_text += f"• 긍정 비율: {kpis.get('긍정비율', 'N/A'):.1f}%\n"
-                kpi_text += f"• 부정 비율: {kpis.get('부정비율', 'N/A'):.1f}%\n"
-                
-                p = content_frame.add_paragraph()
-                p.text = kpi_text
-                p.font.size = Pt(14)
+                kpi_text = f"• 총 리뷰 수: {_format_kpi(kpis.get('총리뷰수'), ',', '개')}\n"
+                kpi_text += f"• 평균 평점: {_format_kpi(kpis.get('평균평점'), '.1f', '점')}\n"
+                kpi_text += f"• 긍정 비율: {_format_kpi(kpis.get('긍정비율'), '.1f', '%')}\n"
+                kpi_text += f"• 부정 비율: {_format_kpi(kpis.get('부정비율'), '.1f', '%')}\n"
+                paragraphs.append((kpi_text, 14, False))
                 
             # 주요 인사이트 추가
             insights = analysis_results.get('주요인사이트', [])
             if insights:
-                p = content_frame.add_paragraph()
-                p.text = "\n💡 주요 인사이트"
-                p.font.size = Pt(18)
-                p.font.bold = True
-                
-                insight_text = ""
-                for i, insight in enumerate(insights[:3], 1):  # 상위 3개만
-                    insight_text += f"{i}. {insight}\n"
-                
-                p = content_frame.add_paragraph()
-                p.text = insight_text
-                p.font.size = Pt(12)
+                paragraphs.append(("\n💡 주요 인사이트", 18, True))
+                insight_text = "".join(
+                    f"{i}. {insight}\n" for i, insight in enumerate(insights[:3], 1)  # 상위 3개만
+                )
+                paragraphs.append((insight_text, 12, False))
             
             # 개선 우선순위 추가
             priorities = analysis_results.get('개선우선순위', [])
             if priorities:
-                p = content_frame.add_paragraph()
-                p.text = "\n🎯 개선 우선순위"
-                p.font.size = Pt(18)
-                p.font.bold = True
-                
-                priority_text = ""
-                for i, priority in enumerate(priorities[:3], 1):  # 상위 3개만
-                    priority_text += f"{i}. {priority}\n"
-                
-                p = content_frame.add_paragraph()
-                p.text = priority_text
-                p.font.size = Pt(12)
+                paragraphs.append(("\n🎯 개선 우선순위", 18, True))
+                priority_text = "".join(
+                    f"{i}. {priority}\n" for i, priority in enumerate(priorities[:3], 1)  # 상위 3개만
+                )
+                paragraphs.append((priority_text, 12, False))
             
             # 전략적 제언 추가
             strategies = analysis_results.get('전략적제언', {})
             if strategies:
-                p = content_frame.add_paragraph()
-                p.text = "\n📈 전략적 제언"
-                p.font.size = Pt(18)
-                p.font.bold = True
-                
-                strategy_text = ""
-                for period, strategy in strategies.items():
-                    if strategy:
-                        strategy_text += f"• {period}: {str(strategy)[:50]}...\n"
-                
-                p = content_frame.add_paragraph()
-                p.text = strategy_text
-                p.font.size = Pt(12)
+                paragraphs.append(("\n📈 전략적 제언", 18, True))
+                strategy_text = "".join(
+                    f"• {period}: {str(strategy)[:50]}...\n"
+                    for period, strategy in strategies.items() if strategy
+                )
+                paragraphs.append((strategy_text, 12, False))
+            
+            # 콘텐츠 영역 (첫 문단은 기본 문단을 재사용하고 나머지만 추가)
+            content_frame = slide.placeholders[1].text_frame
+            content_frame.clear()
+            for i, (text, size, bold) in enumerate(paragraphs):
+                p = content_frame.paragraphs[0] if i == 0 else content_frame.add_paragraph()
+                p.text = text
+                p.font.size = Pt(size)
+                if bold:
+                    p.font.bold = True
             
             # 프레젠테이션 저장
             prs.save(str(pptx_path))
@@ -312,14 +242,12 @@ class ExportGenerator:
         Returns:
             생성된 파일 경로들의 딕셔너리
         """
-        results = {}
-        
-        # PDF 생성
-        pdf_path = self.generate_pdf()
-        results['pdf'] = pdf_path
-        
-        # PPTX 생성
-        pptx_path = self.generate_pptx(analysis_results, plot_files)
-        results['pptx'] = pptx_path
-        
-        return results
+        # PDF(wkhtmltopdf 외부 프로세스)와 PPTX(파이썬 파일 생성)는 자원을 공유하지 않으므로 동시에 생성
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            pdf_future = executor.submit(self.generate_pdf)
+            pptx_future = executor.submit(self.generate_pptx, analysis_results, plot_files)
+            
+            return {
+                'pdf': pdf_future.result(),
+                'pptx': pptx_future.result()
+            }
@@ -8,12 +8,24 @@ from typing import Tuple, Optional
 import logging
 from pathlib import Path
 
-from .config import DATA_PATH
+from .config import DATA_PATH, RATING_RANGE
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+try:
+    import pyarrow  # noqa: F401
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# 분석에 필요한 컬럼 (이 외의 컬럼은 읽지 않음)
+REQUIRED_COLUMNS = frozenset(('제목', '내용', '평점', '작성일자', '평가', '이용자', '구분'))
+
+# CSV 컬럼별 명시 dtype (추론 생략)
+CSV_DTYPES = {'제목': str, '내용': str, '평점': str, '평가': str, '이용자': 'category', '구분': 'category'}
+
 class DataLoader:
     """데이터 로드 및 전처리 클래스"""
     
@@ -25,7 +37,19 @@ class DataLoader:
         """CSV 파일을 로드합니다."""
         try:
             logger.info(f"데이터 로드 중: {self.data_path}")
-            self.df = pd.read_csv(self.data_path, encoding='utf-8')
+            # 필요한 컬럼만 파싱 (누락 컬럼은 오류 없이 건너뛰고 스키마 검증에서 보고)
+            # 평점은 공백 섞인 값이 있으므로 문자열로 읽어 전처리에서 한 번만 숫자로 변환
+            if PYARROW_AVAILABLE:
+                # PyArrow 엔진은 callable usecols를 지원하지 않으므로 헤더로 컬럼 목록을 먼저 구성
+                header = pd.read_csv(self.data_path, encoding='utf-8', nrows=0).columns
+                usecols = [col for col in header if col in REQUIRED_COLUMNS]
+                # PyArrow 멀티스레드 CSV 파서 사용 (작성일자도 파싱 단계에서 변환)
+                self.df = pd.read_csv(self.data_path, encoding='utf-8', engine='pyarrow',
+                                      usecols=usecols, dtype=CSV_DTYPES,
+                                      parse_dates=[col for col in ('작성일자',) if col in usecols])
+            else:
+                self.df = pd.read_csv(self.data_path, encoding='utf-8',
+                                      usecols=REQUIRED_COLUMNS.__contains__, dtype=CSV_DTYPES)
             logger.info(f"데이터 로드 완료: {len(self.df)} 행, {len(self.df.columns)} 컬럼")
             return self.df
         except FileNotFoundError:
@@ -37,14 +61,12 @@ class DataLoader:
     
     def validate_schema(self) -> bool:
         """데이터 스키마를 검증합니다."""
-        expected_columns = ['제목', '내용', '평점', '작성일자', '평가', '이용자', '구분']
-        
         if self.df is None:
             logger.error("데이터가 로드되지 않았습니다.")
             return False
             
-        missing_columns = set(expected_columns) - set(self.df.columns)
-        if missing_columns:
+        if not REQUIRED_COLUMNS.issubset(self.df.columns):
+            missing_columns = set(REQUIRED_COLUMNS.difference(self.df.columns))
             logger.error(f"필수 컬럼이 누락되었습니다: {missing_columns}")
             return False
             
@@ -78,28 +100,39 @@ class DataLoader:
     
     def _preprocess_ratings(self) -> None:
         """평점 데이터를 전처리합니다."""
-        # 평점 컬럼에서 공백 제거 및 숫자 변환
-        self.df['평점'] = self.df['평점'].astype(str).str.strip()
-        
-        # 숫자가 아닌 값 처리
-        self.df['평점'] = pd.to_numeric(self.df['평점'], errors='coerce')
-        
-        # 평점 범위 검증 (1-10)
-        invalid_ratings = self.df[(self.df['평점'] < 1) | (self.df['평점'] > 10)]
-        if len(invalid_ratings) > 0:
-            logger.warning(f"유효하지 않은 평점 {len(invalid_ratings)}개 발견")
+        # 평점 컬럼(문자열로 로드)에서 공백 제거 후 숫자 변환 (숫자가 아닌 값은 NaN)
+        self.df['평점'] = pd.to_numeric(self.df['평점'].str.strip(), errors='coerce')
+        
+        # 평점 범위 검증 (RATING_RANGE, 평점 컬럼의 불리언 마스크만 사용)
+        ratings = self.df['평점']
+        invalid_mask = ratings.lt(RATING_RANGE[0]) | ratings.gt(RATING_RANGE[1])
+        invalid_count = int(invalid_mask.sum())
+        if invalid_count > 0:
+            logger.warning(f"유효하지 않은 평점 {invalid_count}개 발견")
             # 유효하지 않은 평점을 NaN으로 설정
-            self.df.loc[invalid_ratings.index, '평점'] = np.nan
+            self.df['평점'] = ratings.where(~invalid_mask)
     
     def _preprocess_dates(self) -> None:
         """날짜 데이터를 전처리합니다."""
         # 작성일자를 datetime으로 변환
         self.df['작성일자'] = pd.to_datetime(self.df['작성일자'], errors='coerce')
         
-        # 연도, 월, 분기 컬럼 추가
-        self.df['연도'] = self.df['작성일자'].dt.year
-        self.df['월'] = self.df['작성일자'].dt.month
-        self.df['분기'] = self.df['작성일자'].dt.quarter
+        # 연도, 월, 분기 컬럼 추가 (월 단위 datetime64로 한 번 변환한 값에서 세 컬럼을 모두 계산)
+        months = self.df['작성일자'].to_numpy(dtype='datetime64[M]')
+        valid = ~np.isnat(months)
+        month_index = months.astype(np.int64)
+        year = month_index // 12 + 1970
+        month = month_index % 12 + 1
+        quarter = (month - 1) // 3 + 1
+        if valid.all():
+            # 결측 날짜가 없으면 작은 정수 타입으로 저장
+            self.df['연도'] = year.astype(np.int16)
+            self.df['월'] = month.astype(np.int8)
+            self.df['분기'] = quarter.astype(np.int8)
+        else:
+            self.df['연도'] = np.where(valid, year, np.nan)
+            self.df['월'] = np.where(valid, month, np.nan)
+            self.df['분기'] = np.where(valid, quarter, np.nan)
         
         # 유효하지 않은 날짜 처리
         invalid_dates = self.df[self.df['작성일자'].isna()]
@@ -108,22 +141,23 @@ class DataLoader:
     
     def _handle_missing_values(self) -> None:
         """결측치를 처리합니다."""
-        # 결측치 현황 로깅
+        # 결측치 현황 로깅 (컬럼별 결측 수를 한 번만 계산해 재사용)
         missing_info = self.df.isnull().sum()
-        if missing_info.sum() > 0:
-            logger.info(f"결측치 현황:\n{missing_info[missing_info > 0]}")
+        missing_columns = missing_info[missing_info > 0]
+        if len(missing_columns) > 0:
+            logger.info(f"결측치 현황:\n{missing_columns}")
         
         # 평점 결측치 처리 (중앙값으로 대체)
-        if self.df['평점'].isnull().sum() > 0:
+        missing_ratings = int(missing_info.get('평점', 0))
+        if missing_ratings > 0:
             median_rating = self.df['평점'].median()
-            self.df['평점'].fillna(median_rating, inplace=True)
-            logger.info(f"평점 결측치 {self.df['평점'].isnull().sum()}개를 중앙값({median_rating})으로 대체")
+            self.df['평점'] = self.df['평점'].fillna(median_rating)
+            logger.info(f"평점 결측치 {missing_ratings}개를 중앙값({median_rating})으로 대체")
         
-        # 텍스트 결측치 처리
-        text_columns = ['제목', '내용', '평가']
-        for col in text_columns:
-            if col in self.df.columns:
-                self.df[col].fillna('', inplace=True)
+        # 텍스트 결측치 처리 (존재하는 텍스트 컬럼을 한 번에 채움)
+        text_columns = [col for col in ('제목', '내용', '평가') if col in self.df.columns]
+        if text_columns:
+            self.df[text_columns] = self.df[text_columns].fillna('')
     
     def _handle_outliers(self) -> None:
         """이상치를 처리합니다."""
@@ -134,12 +168,12 @@ class DataLoader:
         lower_bound = Q1 - 1.5 * IQR
         upper_bound = Q3 + 1.5 * IQR
         
-        outliers = self.df[(self.df['평점'] < lower_bound) | (self.df['평점'] > upper_bound)]
-        if len(outliers) > 0:
-            logger.warning(f"평점 이상치 {len(outliers)}개 발견 (범위: {lower_bound:.2f} ~ {upper_bound:.2f})")
-            # 이상치를 경계값으로 조정
-            self.df.loc[self.df['평점'] < lower_bound, '평점'] = lower_bound
-            self.df.loc[self.df['평점'] > upper_bound, '평점'] = upper_bound
+        ratings = self.df['평점'].to_numpy(dtype=float)
+        outlier_count = int(np.count_nonzero((ratings < lower_bound) | (ratings > upper_bound)))
+        if outlier_count > 0:
+            logger.warning(f"평점 이상치 {outlier_count}개 발견 (범위: {lower_bound:.2f} ~ {upper_bound:.2f})")
+            # 이상치를 경계값으로 조정 (NaN은 그대로 유지)
+            self.df['평점'] = np.clip(ratings, lower_bound, upper_bound)
     
     def _clean_text_data(self) -> None:
         """텍스트 데이터를 정제합니다."""
@@ -148,8 +182,6 @@ class DataLoader:
         for col in text_columns:
             if col in self.df.columns:
                 self.df[col] = self.df[col].astype(str).str.strip()
-                # 빈 문자열을 NaN으로 변환 후 다시 빈 문자열로
-                self.df[col] = self.df[col].replace('', np.nan).fillna('')
     
     def get_data_info(self) -> dict:
         """데이터 기본 정보를 반환합니다."""
@@ -175,7 +207,8 @@ class DataLoader:
             self.validate_schema()
             self.preprocess_data()
         
-        return self.df.copy()
+        # 얕은 복사: 데이터는 공유하고, 호출 측의 컬럼 추가/교체는 self.df에 반영되지 않음
+        return self.df.copy(deep=False)
 
 def load_and_preprocess_data() -> Tuple[pd.DataFrame, dict]:
     """데이터를 로드하고 전처리하여 반환합니다."""
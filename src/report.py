@@ -1,7 +1,6 @@
 """
 리포트 생성 모듈 - HTML 리포트 생성
 """
-import pandas as pd
 from datetime import datetime
 from typing import Dict, Any
 import logging
@@ -15,35 +14,43 @@ logger = logging.getLogger(__name__)
 class ReportGenerator:
     """HTML 리포트 생성 클래스"""
     
+    # 컴파일된 템플릿을 인스턴스 간에 재사용하도록 Jinja2 환경은 프로세스당 하나만 생성
+    _env = None
+    
     def __init__(self):
         self.template_dir = TEMPLATE_DIR
         self.report_dir = REPORT_DIR
         self.report_config = REPORT_CONFIG
         
-        # Jinja2 환경 설정
-        self.env = Environment(
-            loader=FileSystemLoader(str(self.template_dir)),
-            autoescape=True
-        )
+        # Jinja2 환경 설정 (배포된 템플릿은 바뀌지 않으므로 렌더링마다 파일 변경 여부를 확인하지 않음)
+        if ReportGenerator._env is None:
+            ReportGenerator._env = Environment(
+                loader=FileSystemLoader(str(self.template_dir)),
+                autoescape=True,
+                auto_reload=False
+            )
+        self.env = ReportGenerator._env
+        self._report_template = self.env.get_template('report.html')
+        self._summary_template = self.env.get_template('summary.html')
     
     def generate_report(self, analysis_results: Dict[str, Any], 
                        plot_files: Dict[str, str]) -> str:
         """HTML 리포트를 생성합니다."""
         logger.info("HTML 리포트 생성 시작")
         
+        # 생성 시각은 한 번만 읽어 파일명과 본문에 같이 사용
+        now = datetime.now()
+        
         try:
             # 템플릿 렌더링을 위한 데이터 준비
-            template_data = self._prepare_template_data(analysis_results, plot_files)
-            
-            # 템플릿 로드 및 렌더링
-            template = self.env.get_template('report.html')
-            html_content = template.render(**template_data)
+            template_data = self._prepare_template_data(analysis_results, plot_files,
+                                                        now.strftime('%Y년 %m월 %d일 %H:%M'))
             
-            # 리포트 파일 저장
-            report_filename = self.report_dir / f"report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
+            # 리포트 파일 저장 (전체 HTML 문자열을 만들지 않고 렌더링 조각을 큰 버퍼로 바로 기록)
+            report_filename = self.report_dir / f"report_{now.strftime('%Y%m%d_%H%M%S')}.html"
             
-            with open(report_filename, 'w', encoding='utf-8') as f:
-                f.write(html_content)
+            with open(report_filename, 'w', encoding='utf-8', buffering=262144) as f:
+                self._report_template.stream(**template_data).dump(f)
             
             logger.info(f"HTML 리포트 생성 완료: {report_filename}")
             return str(report_filename)
@@ -53,14 +60,14 @@ class ReportGenerator:
             raise
     
     def _prepare_template_data(self, analysis_results: Dict[str, Any], 
-                              plot_files: Dict[str, str]) -> Dict[str, Any]:
+                              plot_files: Dict[str, str], generated_date: str) -> Dict[str, Any]:
         """템플릿 렌더링을 위한 데이터를 준비합니다."""
         
         # 기본 리포트 정보
         template_data = {
             'title': self.report_config['title'],
             'version': self.report_config['version'],
-            'generated_date': datetime.now().strftime('%Y년 %m월 %d일 %H:%M'),
+            'generated_date': generated_date,
             'reproduction_command': self.report_config['reproduction_command']
         }
         
@@ -96,15 +103,17 @@ class ReportGenerator:
         """요약 리포트를 생성합니다."""
         logger.info("요약 리포트 생성 시작")
         
+        now = datetime.now()
+        
         try:
             # 요약 데이터 준비
             summary_data = self._prepare_summary_data(analysis_results)
             
             # 간단한 HTML 요약 리포트 생성
-            html_content = self._create_summary_html(summary_data)
+            html_content = self._create_summary_html(summary_data, now.strftime('%Y년 %m월 %d일 %H:%M'))
             
             # 파일 저장
-            summary_filename = self.report_dir / f"summary_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
+            summary_filename = self.report_dir / f"summary_{now.strftime('%Y%m%d_%H%M%S')}.html"
             
             with open(summary_filename, 'w', encoding='utf-8') as f:
                 f.write(html_content)
@@ -130,11 +139,12 @@ class ReportGenerator:
                 'negative_ratio': kpi.get('부정_비율', 0)
             }
         
-        # 상위 3개 개선사항
+        # 상위 3개 개선사항 (분석 단계에서 이미 레코드로 만든 상위_3개를 사용해 DataFrame을 다시 읽지 않음)
         if '우선순위' in analysis_results:
-            priority_df = analysis_results['우선순위']
-            if len(priority_df) > 0:
-                summary['top_improvements'] = priority_df.head(3).to_dict('records')
+            top_3 = analysis_results['우선순위'].get('상위_3개')
+            if top_3:
+                columns = ('Aspect', '부정_비율', '우선순위_점수')
+                summary['top_improvements'] = [{column: item[column] for column in columns} for item in top_3]
         
         # 주요 인사이트
         summary['insights'] = [
@@ -147,156 +157,6 @@ class ReportGenerator:
         
         return summary
     
-    def _create_summary_html(self, summary_data: Dict[str, Any]) -> str:
+    def _create_summary_html(self, summary_data: Dict[str, Any], generated_date: str) -> str:
         """요약 HTML을 생성합니다."""
-        html = f"""
-        <!DOCTYPE html>
-        <html lang="ko">
-        <head>
-            <meta charset="UTF-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>오색그린야드호텔 리뷰 분석 요약</title>
-            <style>
-                body {{
-                    font-family: 'NanumBarunGothic', 'Malgun Gothic', sans-serif;
-                    line-height: 1.6;
-                    margin: 0;
-                    padding: 20px;
-                    background-color: #f5f5f5;
-                }}
-                .container {{
-                    max-width: 800px;
-                    margin: 0 auto;
-                    background-color: white;
-                    padding: 30px;
-                    border-radius: 10px;
-                    box-shadow: 0 0 20px rgba(0,0,0,0.1);
-                }}
-                .header {{
-                    text-align: center;
-                    border-bottom: 3px solid #4682B4;
-                    padding-bottom: 20px;
-                    margin-bottom: 30px;
-                }}
-                .header h1 {{
-                    color: #4682B4;
-                    margin: 0;
-                }}
-                .section {{
-                    margin-bottom: 30px;
-                    padding: 20px;
-                    border: 1px solid #ddd;
-                    border-radius: 8px;
-                    background-color: #fafafa;
-                }}
-                .section h2 {{
-                    color: #4682B4;
-                    border-bottom: 2px solid #4682B4;
-                    padding-bottom: 10px;
-                    margin-top: 0;
-                }}
-                .kpi-grid {{
-                    display: grid;
-                    grid-template-columns: repeat(auto-fit, minmax(150px, 1fr));
-                    gap: 15px;
-                    margin-bottom: 20px;
-                }}
-                .kpi-item {{
-                    background: linear-gradient(135deg, #4682B4, #5F9EA0);
-                    color: white;
-                    padding: 15px;
-                    border-radius: 8px;
-                    text-align: center;
-                }}
-                .kpi-item .value {{
-                    font-size: 1.5em;
-                    font-weight: bold;
-                    margin: 5px 0;
-                }}
-                .insights {{
-                    background-color: #e8f4f8;
-                    padding: 15px;
-                    border-radius: 8px;
-                    border-left: 4px solid #4682B4;
-                }}
-                .insights ul {{
-                    margin: 0;
-                    padding-left: 20px;
-                }}
-                .priority-item {{
-                    background-color: white;
-                    padding: 10px;
-                    margin: 5px 0;
-                    border-radius: 5px;
-                    border-left: 3px solid #DC143C;
-                }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <div class="header">
-                    <h1>오색그린야드호텔 리뷰 분석 요약</h1>
-                    <p>생성일: {datetime.now().strftime('%Y년 %m월 %d일 %H:%M')}</p>
-                </div>
-                
-                <div class="section">
-                    <h2>핵심 지표</h2>
-                    <div class="kpi-grid">
-                        <div class="kpi-item">
-                            <div>총 리뷰 수</div>
-                            <div class="value">{summary_data.get('kpi', {}).get('total_reviews', 0)}</div>
-                        </div>
-                        <div class="kpi-item">
-                            <div>평균 평점</div>
-                            <div class="value">{summary_data.get('kpi', {}).get('avg_rating', 0):.2f}</div>
-                        </div>
-                        <div class="kpi-item">
-                            <div>긍정 비율</div>
-                            <div class="value">{summary_data.get('kpi', {}).get('positive_ratio', 0):.1f}%</div>
-                        </div>
-                        <div class="kpi-item">
-                            <div>부정 비율</div>
-                            <div class="value">{summary_data.get('kpi', {}).get('negative_ratio', 0):.1f}%</div>
-                        </div>
-                    </div>
-                </div>
-                
-                <div class="section">
-                    <h2>주요 인사이트</h2>
-                    <div class="insights">
-                        <ul>
-        """
-        
-        for insight in summary_data.get('insights', []):
-            html += f"<li>{insight}</li>"
-        
-        html += """
-                        </ul>
-                    </div>
-                </div>
-        """
-        
-        if 'top_improvements' in summary_data:
-            html += """
-                <div class="section">
-                    <h2>상위 개선사항</h2>
-            """
-            
-            for item in summary_data['top_improvements']:
-                html += f"""
-                    <div class="priority-item">
-                        <strong>{item.get('Aspect', '')}</strong><br>
-                        부정 비율: {item.get('부정_비율', 0):.1f}% | 
-                        우선순위 점수: {item.get('우선순위_점수', 0):.2f}
-                    </div>
-                """
-            
-            html += "</div>"
-        
-        html += """
-            </div>
-        </body>
-        </html>
-        """
-        
-        return html
+        return self._summary_template.render(summary_data, generated_date=generated_date)
@@ -4,15 +4,21 @@
 """
 import matplotlib.pyplot as plt
 import matplotlib.font_manager as fm
+from functools import lru_cache
 from pathlib import Path
 
+@lru_cache(maxsize=1)
+def _font_names():
+    """설치된 폰트 이름 집합 (폰트 목록은 한 번만 조회)"""
+    return frozenset(f.name for f in fm.fontManager.ttflist)
+
 def test_korean_fonts():
     """한글 폰트 테스트"""
     print("=== 한글 폰트 테스트 ===")
     
     # 사용 가능한 폰트 목록 출력
     print("\n사용 가능한 폰트들:")
-    available_fonts = [f.name for f in fm.fontManager.ttflist]
+    available_fonts = _font_names()
     korean_fonts = [
         "Malgun Gothic", "NanumGothic", "NanumBarunGothic", 
         "Dotum", "Gulim", "Batang", "Gungsuh", "Arial Unicode MS"
@@ -24,12 +30,8 @@ def test_korean_fonts():
         else:
             print(f"✗ {font} - 사용 불가")
     
-    # 한글 폰트 설정
-    selected_font = None
-    for font in korean_fonts:
-        if font in available_fonts:
-            selected_font = font
-            break
+    # 한글 폰트 설정 (후보 순서대로 첫 번째로 설치된 폰트 선택)
+    selected_font = next((font for font in korean_fonts if font in available_fonts), None)
     
     if selected_font:
         plt.rcParams['font.family'] = selected_font
@@ -61,8 +63,8 @@ def test_korean_fonts():
     
     # 저장
     test_file = Path('font_test.png')
-    plt.savefig(test_file, dpi=150, bbox_inches='tight')
-    plt.close()
+    fig.savefig(test_file, dpi=100)
+    plt.close(fig)
     
     print(f"\n테스트 이미지 저장: {test_file}")
     print("이미지를 확인하여 한글이 제대로 표시되는지 확인하세요.")
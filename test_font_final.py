@@ -15,8 +15,10 @@ def test_font():
         print("폰트 파일을 찾을 수 없습니다!")
         return
     
-    # 폰트 등록
-    fm.fontManager.addfont(str(font_path))
+    # 폰트 등록 (이미 등록된 파일이면 다시 읽지 않음)
+    registered = {Path(f.fname).resolve() for f in fm.fontManager.ttflist}
+    if font_path.resolve() not in registered:
+        fm.fontManager.addfont(str(font_path))
     font_prop = fm.FontProperties(fname=str(font_path))
     
     print(f"폰트 이름: {font_prop.get_name()}")
@@ -40,9 +42,8 @@ def test_font():
     ax.set_ylim(0, 1)
     ax.set_title('한글 폰트 테스트', fontsize=18, fontproperties=font_prop)
     
-    plt.tight_layout()
-    plt.savefig('font_test.png', dpi=150, bbox_inches='tight')
-    plt.close()
+    fig.savefig('font_test.png', dpi=100)
+    plt.close(fig)
     
     print("폰트 테스트 완료! font_test.png 파일을 확인하세요.")
 
@@ -0,0 +1,8 @@
+"""
+WSGI 진입점 - 운영 서버용
+
+    gunicorn wsgi:application --worker-class gthread --workers 2 --threads 4
+"""
+from app import app
+
+application = app